@@ -1,63 +1,104 @@
 from pathlib import Path
-from datetime import datetime
-import json
+from datetime import datetime, time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
 import os
+import re
+import sys
+import textwrap
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Lido uma única vez: variáveis de ambiente não mudam durante o processo
+_APP_ENV = os.getenv("APP_ENV", "development").lower()
+
+
+_BASE_DIR = Path(__file__).resolve().parent
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configurações base"""
+    """Configurações base (imutáveis; um objeto por ambiente)"""
     
-    BASE_DIR = Path(__file__).resolve().parent
-    DATA_DIR = BASE_DIR / "data"
-    LOGS_DIR = BASE_DIR / "logs"
+    BASE_DIR: Path = _BASE_DIR
+    DATA_DIR: Path = _BASE_DIR / "data"
+    LOGS_DIR: Path = _BASE_DIR / "logs"
     
-    BASE_URL = "http://quotes.toscrape.com"
+    BASE_URL: str = "http://quotes.toscrape.com"
     
-    REQUEST_TIMEOUT = 10
-    RETRY_ATTEMPTS = 3
-    RETRY_BACKOFF = 2 
+    REQUEST_TIMEOUT: int = 10
+    RETRY_ATTEMPTS: int = 3
+    RETRY_BACKOFF: int = 2
     
-    DB_PATH = DATA_DIR / "quotes.db"
-    DB_ECHO = False  
+    DB_PATH: Path = _BASE_DIR / "data" / "quotes.db"
+    DB_ECHO: bool = False
     
-    LOG_LEVEL = "INFO"
-    LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LOG_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
     
-    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    DELAY_BETWEEN_REQUESTS = 1 
+    USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    DELAY_BETWEEN_REQUESTS: int = 1
     
-    SCHEDULER_ENABLED = True
-    SCHEDULER_TIME = "14:30" 
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TIME: str = "14:30"
+    SCHEDULER_TIME_PARSED: time = field(init=False)
     
-    EXPORT_FORMATS = ["json", "csv"]
-    CSV_ENCODING = "utf-8"
-    JSON_INDENT = 2
+    EXPORT_FORMATS: tuple = ("json", "csv")
+    CSV_ENCODING: str = "utf-8"
+    JSON_INDENT: int = 2
     
-    MAX_PAGES = None  
-    MAX_RETRIES_BEFORE_EXIT = 5
-
+    MAX_PAGES: Optional[int] = None
+    MAX_RETRIES_BEFORE_EXIT: int = 5
+    
+    # Formas str dos caminhos, derivadas em __post_init__
+    DATA_DIR_STR: str = field(init=False)
+    LOGS_DIR_STR: str = field(init=False)
+    DB_PATH_STR: str = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "DATA_DIR_STR", str(self.DATA_DIR))
+        object.__setattr__(self, "LOGS_DIR_STR", str(self.LOGS_DIR))
+        object.__setattr__(self, "DB_PATH_STR", str(self.DB_PATH))
+        # SCHEDULER_TIME é validado e convertido uma única vez
+        object.__setattr__(
+            self, "SCHEDULER_TIME_PARSED", time.fromisoformat(self.SCHEDULER_TIME)
+        )
 
-class DevelopmentConfig(Config):
-    """Configurações para desenvolvimento"""
-    LOG_LEVEL = "DEBUG"
-    RETRY_ATTEMPTS = 5
-    REQUEST_TIMEOUT = 15
 
+# Configurações para desenvolvimento
+DEVELOPMENT_CONFIG = Config(
+    LOG_LEVEL="DEBUG",
+    RETRY_ATTEMPTS=5,
+    REQUEST_TIMEOUT=15,
+)
 
-class ProductionConfig(Config):
-    """Configurações para produção"""
-    LOG_LEVEL = "INFO"
-    RETRY_ATTEMPTS = 3
-    REQUEST_TIMEOUT = 10
-    SCHEDULER_ENABLED = True
+# Configurações para produção
+PRODUCTION_CONFIG = Config(
+    LOG_LEVEL="INFO",
+    RETRY_ATTEMPTS=3,
+    REQUEST_TIMEOUT=10,
+    SCHEDULER_ENABLED=True,
+)
 
+# Configurações para testes
+TESTING_CONFIG = Config(
+    DB_PATH=Path("./test_quotes.db"),
+    LOG_LEVEL="WARNING",
+    RETRY_ATTEMPTS=1,
+    REQUEST_TIMEOUT=5,
+)
 
-class TestingConfig(Config):
-    """Configurações para testes"""
-    DB_PATH = Path("./test_quotes.db")
-    LOG_LEVEL = "WARNING"
-    RETRY_ATTEMPTS = 1
-    REQUEST_TIMEOUT = 5
+_CONFIGS = {
+    "development": DEVELOPMENT_CONFIG,
+    "production": PRODUCTION_CONFIG,
+    "testing": TESTING_CONFIG,
+}
 
 
 def get_config(env: str = None) -> Config:
@@ -71,16 +112,12 @@ def get_config(env: str = None) -> Config:
     Returns:
         Instância de Config apropriada
     """
-    if env is None:
-        env = os.getenv("APP_ENV", "development").lower()
-    
-    config_map = {
-        "development": DevelopmentConfig(),
-        "production": ProductionConfig(),
-        "testing": TestingConfig(),
-    }
-    
-    return config_map.get(env, DevelopmentConfig())
+    env = env if env is not None else _APP_ENV
+    try:
+        return _CONFIGS[env]
+    except KeyError:
+        # Ambiente desconhecido: usa desenvolvimento, sem criar nada novo
+        return DEVELOPMENT_CONFIG
 
 
 class DatabaseConfig:
@@ -121,14 +158,24 @@ class DatabaseConfig:
         }
     }
     
+    # Remove a indentação dos schemas uma única vez, na definição da classe
+    for _table_config in TABLES.values():
+        _table_config["schema"] = sys.intern(
+            textwrap.dedent(_table_config["schema"]).strip()
+        )
+    del _table_config
+    
+    # TABLES é constante: as queries são achatadas uma única vez
+    _INIT_SQL = tuple(
+        query
+        for table_config in TABLES.values()
+        for query in (table_config["schema"], *table_config["indices"])
+    )
+    
     @classmethod
-    def get_init_sql(cls) -> list:
+    def get_init_sql(cls) -> tuple:
         """Retorna todas as queries de inicialização"""
-        queries = []
-        for table_config in cls.TABLES.values():
-            queries.append(table_config["schema"])
-            queries.extend(table_config["indices"])
-        return queries
+        return cls._INIT_SQL
 
 
 class SelectorConfig:
@@ -142,19 +189,32 @@ class SelectorConfig:
     NEXT_PAGE = 'li.next'
     PAGINATION = '.pager'
     
-    TEXT_CLEAN = {
-        'quotes': ['"', '"', '"'],
-        'replacements': ['', '', '']
-    }
+    # Remove aspas retas e tipográficas (U+201C/U+201D) numa única passada
+    TEXT_CLEAN_TABLE = str.maketrans({'"': '', '\u201c': '', '\u201d': ''})
     
-    AUTHOR_CLEAN = {
-        'prefixes': ['by ', 'By ', 'BY ']
-    }
+    _AUTHOR_PREFIX_RE = re.compile(r'^by\s+', re.IGNORECASE)
+    
+    @classmethod
+    def clean_text(cls, text: str) -> str:
+        """Remove as aspas do texto da citação"""
+        return text.translate(cls.TEXT_CLEAN_TABLE)
+    
+    @classmethod
+    def clean_author(cls, author: str) -> str:
+        """Remove o prefixo 'by ' do nome do autor"""
+        return cls._AUTHOR_PREFIX_RE.sub('', author, count=1)
     
     @classmethod
     def get_selector(cls, selector_name: str) -> str:
         """Retorna seletor pelo nome"""
-        return getattr(cls, selector_name, None)
+        return cls._SELECTORS.get(selector_name)
+
+
+# Seletores indexados por nome, montados uma única vez
+SelectorConfig._SELECTORS = {
+    k: v for k, v in vars(SelectorConfig).items()
+    if k.isupper() and isinstance(v, str)
+}
 
 
 class ExportConfig:
@@ -172,10 +232,11 @@ class ExportConfig:
     VERSION = "1.0.0"
     INCLUDE_METADATA = True
     
-    # Campos para exportação
+    # Campos para exportação (tupla imutável compartilhada pelos formatos)
+    _FIELDS = ("text", "author", "tags", "scraped_at")
     FIELDS = {
-        "json": ["text", "author", "tags", "scraped_at"],
-        "csv": ["text", "author", "tags", "scraped_at"]
+        "json": _FIELDS,
+        "csv": _FIELDS
     }
 
 
@@ -187,6 +248,7 @@ class ScheduleConfig:
         "hour": 14,
         "minute": 30
     }
+    DAILY_TIME = time(DAILY_SCHEDULE["hour"], DAILY_SCHEDULE["minute"])
     
     # Tipos de agenda
     SCHEDULE_TYPES = {
@@ -203,46 +265,89 @@ class ScheduleConfig:
 class AppConfig:
     """Configuração centralizada da aplicação"""
     
+    # "__dict__" é necessário para o cache dos cached_property abaixo
+    __slots__ = ("env", "config", "_static_dict", "__dict__")
+    
     def __init__(self, env: str = None):
-        self.env = env or os.getenv("APP_ENV", "development")
+        self.env = env or _APP_ENV
         self.config = get_config(self.env)
-        self.database = DatabaseConfig()
-        self.selectors = SelectorConfig()
-        self.export = ExportConfig()
-        self.schedule = ScheduleConfig()
-    
-    def to_dict(self) -> dict:
-        """Converte config para dicionário"""
-        return {
+        # Parte invariante de to_dict, calculada uma única vez
+        self._static_dict = {
             "environment": self.env,
             "base_url": self.config.BASE_URL,
-            "database": str(self.config.DB_PATH),
+            "database": self.config.DB_PATH_STR,
             "log_level": self.config.LOG_LEVEL,
-            "timestamp": datetime.now().isoformat()
         }
     
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        """Configurações do banco, criadas no primeiro acesso"""
+        return DatabaseConfig()
+    
+    @cached_property
+    def selectors(self) -> SelectorConfig:
+        """Seletores CSS, criados no primeiro acesso"""
+        return SelectorConfig()
+    
+    @cached_property
+    def export(self) -> ExportConfig:
+        """Configurações de exportação, criadas no primeiro acesso"""
+        return ExportConfig()
+    
+    @cached_property
+    def schedule(self) -> ScheduleConfig:
+        """Configurações de agendamento, criadas no primeiro acesso"""
+        return ScheduleConfig()
+    
+    def to_dict(self) -> dict:
+        """Converte config para dicionário"""
+        return {**self._static_dict, "timestamp": datetime.now().isoformat()}
+    
     def export_json(self, filepath: str = None):
         """Exporta configuração para JSON"""
         if filepath is None:
             filepath = self.config.DATA_DIR / f"config_{self.env}.json"
         
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if ORJSON_AVAILABLE:
+            Path(filepath).write_bytes(
+                orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+            )
+        else:
+            import json
+            
+            with open(filepath, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
         
         return filepath
 
 
-# Instância global
-app_config = AppConfig()
+# Instância global, criada sob demanda
+_app_config = None
+
+
+def get_app_config() -> AppConfig:
+    """Retorna a instância global de AppConfig, criando-a no primeiro acesso"""
+    global _app_config
+    if _app_config is None:
+        _app_config = AppConfig()
+    return _app_config
+
+
+def __getattr__(name: str):
+    """Mantém `config.app_config` funcionando sem construí-lo no import (PEP 562)"""
+    if name == "app_config":
+        return get_app_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    import json
+    
     # Teste de configuração
     config = AppConfig("production")
     print("Configuração Ativa:")
     print(json.dumps(config.to_dict(), indent=2))
     
     print("\nSeletores:")
-    for attr in dir(config.selectors):
-        if not attr.startswith('_') and attr.isupper():
-            print(f"  {attr}: {getattr(config.selectors, attr)}")
\ No newline at end of file
+    for name, value in SelectorConfig._SELECTORS.items():
+        print(f"  {name}: {value}")
\ No newline at end of file
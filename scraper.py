@@ -2,18 +2,31 @@ import os
 import sys
 import json
 import csv
+import functools
 import logging
+import re
 import sqlite3
+import statistics
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from html import unescape
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 import base64
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
-from apscheduler.schedulers.background import BackgroundScheduler
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+
+from config import SelectorConfig
 
 try:
     from selenium import webdriver
@@ -36,15 +49,58 @@ except ImportError:
     print("   Pandas não instalado. Análise avançada desabilitada.")
     print("   Para habilitar: pip install pandas")
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    print("   selectolax não instalado. Extração rápida usará lxml.")
+    print("   Para habilitar: pip install selectolax")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("   orjson não instalado. Usando json da biblioteca padrão.")
+    print("   Para habilitar: pip install orjson")
+
+
+def _json_bytes(obj) -> bytes:
+    """Serializa em JSON UTF-8 (orjson, se disponível)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_dumps(obj) -> str:
+    """Serializa em JSON como str, para colunas TEXT do SQLite"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _decode_tags(tags):
+    """Decodifica tags vindas do banco (JSON); listas já decodificadas passam direto"""
+    return _json_loads(tags) if isinstance(tags, (str, bytes)) else tags
+
 # ============== CONFIGURAÇÕES ==============
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Quote:
-    """Modelo de dados para uma citação"""
+    """Modelo de dados para uma citação (imutável, sem __dict__ por instância)"""
     text: str
     author: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     scraped_at: str
+    
+    def __post_init__(self):
+        # Tags sempre em tupla: a Quote fica imutável de fato e hashable
+        if not isinstance(self.tags, tuple):
+            object.__setattr__(self, 'tags', tuple(self.tags))
 
 
 class ScraperConfig:
@@ -57,13 +113,18 @@ class ScraperConfig:
     TIMEOUT = 10
     RETRY_ATTEMPTS = 3
     MAX_PAGES = 100  # Limite de páginas a serem extraídas
+    MAX_WORKERS = 10  # Páginas buscadas em paralelo
+    HTML_PARSER = "lxml"  # Parser em C (libxml2), bem mais rápido que html.parser
+    USE_REGEX_FAST_PATH = False  # extract_quotes_fast por regex, sem montar DOM
+    MAX_CACHED_PAGES = MAX_PAGES  # Páginas guardadas para 304; as mais antigas saem primeiro
     
     @classmethod
-    def setup_dirs(cls):
-        """Cria diretórios necessários"""
-        cls.OUTPUT_DIR.mkdir(exist_ok=True)
-        cls.LOGS_DIR.mkdir(exist_ok=True)
-        cls.SCREENSHOTS_DIR.mkdir(exist_ok=True)
+    def setup_dirs(cls, output_dir: Optional[Path] = None, logs_dir: Optional[Path] = None,
+                   screenshots_dir: Optional[Path] = None):
+        """Cria diretórios necessários (por padrão, os da configuração)"""
+        (output_dir or cls.OUTPUT_DIR).mkdir(exist_ok=True)
+        (logs_dir or cls.LOGS_DIR).mkdir(exist_ok=True)
+        (screenshots_dir or cls.SCREENSHOTS_DIR).mkdir(exist_ok=True)
 
 
 # ============== LOGGING ==============
@@ -99,14 +160,44 @@ def setup_logger(name: str) -> logging.Logger:
 
 logger = setup_logger("QuotesScraper")
 
+
+def retry(*exceptions, backoff: int = 2):
+    """Decorator de retry com backoff exponencial para código de rede
+    
+    Tenta ScraperConfig.RETRY_ATTEMPTS vezes, dormindo backoff ** tentativa
+    segundos entre elas (não após a última), e relança a última exceção.
+    """
+    exceptions = exceptions or (Exception,)
+    
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempts = ScraperConfig.RETRY_ATTEMPTS
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    logger.warning(f"Tentativa {attempt + 1}/{attempts} falhou: {e}")
+                    if attempt + 1 == attempts:
+                        raise
+                    time.sleep(backoff ** attempt)
+        return wrapper
+    return decorator
+
+
 class ScreenshotManager:
     """Gerencia screenshots REAIS em PNG usando Selenium"""
     
     def __init__(self):
         self.driver = None
+        # O scheduler pode capturar em paralelo com a CLI
+        self._lock = threading.Lock()
     
     def setup_driver(self):
-        """Configura Chrome em modo headless"""
+        """Configura Chrome em modo headless (reutiliza o driver já aberto)"""
+        if self.driver is not None:
+            return True
+        
         try:
             chrome_options = Options()
             chrome_options.add_argument('--headless') 
@@ -145,22 +236,34 @@ class ScreenshotManager:
             logger.error(f"Erro ao configurar WebDriver: {e}")
             return False
     
-    def take_screenshot(self, url: str, quotes_count: int) -> Optional[str]:
-        """Captura screenshot REAL da página em PNG"""
+    def take_screenshot(self, url: str, quotes_count: int, reuse_today: bool = False) -> Optional[str]:
+        """Captura screenshot REAL da página em PNG
+        
+        Args:
+            reuse_today: Se já houver screenshot de hoje, devolve-o sem abrir o navegador
+        """
+        if reuse_today:
+            today = datetime.now().strftime('%Y%m%d')
+            existing = sorted(ScraperConfig.SCREENSHOTS_DIR.glob(f"screenshot_{today}_*.png"))
+            if existing:
+                logger.info(f"Reutilizando screenshot de hoje: {existing[-1]}")
+                return str(existing[-1])
+        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"screenshot_{timestamp}.png"
         filepath = ScraperConfig.SCREENSHOTS_DIR / filename
         
         try:
-            self.setup_driver()
-            
-            logger.info(f"Capturando screenshot de: {url}")
-            self.driver.get(url)
-            
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "quote"))
-            )
-            self.driver.save_screenshot(str(filepath))
+            with self._lock:
+                self.setup_driver()
+                
+                logger.info(f"Capturando screenshot de: {url}")
+                self.driver.get(url)
+                
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "quote"))
+                )
+                self.driver.save_screenshot(str(filepath))
             logger.info(f"📸 Screenshot salvo: {filepath}")
             metadata_file = filepath.with_suffix('.json')
             metadata = {
@@ -181,11 +284,15 @@ class ScreenshotManager:
     
     def close(self):
         """Fecha WebDriver"""
+        if self.driver is None:
+            return
         try:
             self.driver.quit()
             logger.info("WebDriver fechado")
         except Exception as e:
             logger.warning(f"Erro ao fechar WebDriver: {e}")
+        finally:
+            self.driver = None
     
     def __del__(self):
         """Destrutor - fecha driver automaticamente"""
@@ -198,11 +305,25 @@ class DatabaseManager:
     
     def __init__(self, db_path: Path = ScraperConfig.DB_PATH):
         self.db_path = db_path
+        # Conexão única, reaproveitada por todos os métodos: mantém os
+        # PRAGMAs e o cache de páginas entre as operações. Pode ser usada
+        # pela thread do scheduler, então o acesso é serializado pelo lock.
+        # isolation_level=None: autocommit, transações só onde há BEGIN explícito
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        # WAL + synchronous=NORMAL evitam dois fsyncs por commit; aplicados
+        # logo na abertura, antes de qualquer escrita (inclusive o DDL)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self._lock = threading.Lock()
         self.init_db()
     
     def init_db(self):
         """Inicializa banco de dados"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS quotes (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -223,46 +344,89 @@ class DatabaseManager:
                     screenshot_path TEXT
                 )
             """)
-            conn.commit()
+            # Índices para COUNT(DISTINCT author) e ORDER BY scraped_at DESC
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_quotes_author ON quotes(author)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_quotes_scraped ON quotes(scraped_at DESC)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_execution_date ON execution_history(execution_date)"
+            )
         logger.info(f"Banco de dados inicializado: {self.db_path}")
     
     def insert_quotes(self, quotes: List[Quote]) -> int:
         """Insere citações, evitando duplicatas"""
-        inserted = 0
-        with sqlite3.connect(self.db_path) as conn:
-            for quote in quotes:
-                try:
-                    conn.execute("""
-                        INSERT INTO quotes (text, author, tags, scraped_at)
-                        VALUES (?, ?, ?, ?)
-                    """, (quote.text, quote.author, json.dumps(quote.tags), quote.scraped_at))
-                    inserted += 1
-                except sqlite3.IntegrityError:
-                    logger.debug(f"Citação duplicada: {quote.text[:50]}...")
-            conn.commit()
+        rows = [(q.text, q.author, _json_dumps(q.tags), q.scraped_at) for q in quotes]
+        with self._lock, self.conn as conn:
+            conn.execute("BEGIN")
+            # Duplicatas (UNIQUE em text) são descartadas pelo próprio SQLite,
+            # então o rowcount do lote é o número de linhas realmente inseridas
+            inserted = conn.executemany("""
+                INSERT OR IGNORE INTO quotes (text, author, tags, scraped_at)
+                VALUES (?, ?, ?, ?)
+            """, rows).rowcount
+        logger.debug(f"{len(rows) - inserted} citações duplicadas ignoradas")
         return inserted
     
-    def log_execution(self, scraped: int, inserted: int, status: str, screenshot: str):
-        """Registra histórico de execução"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+    def log_execution(self, scraped: int, inserted: int, status: str, screenshot: str) -> int:
+        """Registra histórico de execução e retorna o id do registro"""
+        # Um único INSERT em autocommit: sem transação nem commit explícitos
+        with self._lock:
+            return self.conn.execute("""
                 INSERT INTO execution_history 
                 (quotes_scraped, quotes_inserted, status, screenshot_path)
                 VALUES (?, ?, ?, ?)
-            """, (scraped, inserted, status, screenshot))
-            conn.commit()
+            """, (scraped, inserted, status, screenshot)).lastrowid
     
     def get_all_quotes(self) -> List[Dict]:
         """Retorna todas as citações"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM quotes ORDER BY scraped_at DESC")
+        with self._lock:
+            cursor = self.conn.execute("SELECT * FROM quotes ORDER BY scraped_at DESC")
+            cursor.row_factory = sqlite3.Row
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_all_quotes_df(self) -> 'pd.DataFrame':
+        """Retorna todas as citações direto num DataFrame (sem dicts intermediários)"""
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT * FROM quotes ORDER BY scraped_at DESC",
+                self.conn,
+                parse_dates=['scraped_at']
+            )
+    
+    _EXPORT_QUERY = "SELECT text, author, tags, scraped_at FROM quotes ORDER BY scraped_at DESC"
+    
+    def _read_export_frame(self) -> 'pd.DataFrame':
+        """Lê os campos de exportação num DataFrame, com as tags decodificadas"""
+        with self._lock:
+            df = pd.read_sql_query(self._EXPORT_QUERY, self.conn)
+        df['tags'] = [_json_loads(tags) for tags in df['tags'].values]
+        return df
+    
+    def export_csv(self, filepath: Path) -> Path:
+        """Exporta as citações do banco para CSV (tags separadas por '|')
+        
+        As linhas do cursor vão direto para o csv.writer, sem DataFrame.
+        """
+        with self._lock, open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(_QUOTE_FIELDS)
+            writer.writerows(
+                (text, author, '|'.join(_json_loads(tags)), scraped_at)
+                for text, author, tags, scraped_at in self.conn.execute(self._EXPORT_QUERY)
+            )
+        logger.info(f"Salvo: {filepath}")
+        return filepath
+    
+    def export_json(self, filepath: Path) -> Path:
+        """Exporta as citações do banco para JSON (lista de registros)"""
+        df = self._read_export_frame()
+        df.to_json(filepath, orient='records', force_ascii=False, indent=2)
+        logger.info(f"Salvo: {filepath}")
+        return filepath
+    
     def get_statistics(self) -> Dict:
         """Retorna estatísticas do banco"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
+        with self._lock:
+            cursor = self.conn.execute("""
                 SELECT 
                     COUNT(*) as total,
                     COUNT(DISTINCT author) as authors
@@ -270,17 +434,102 @@ class DatabaseManager:
             """)
             row = cursor.fetchone()
             
-            cursor = conn.execute("""
+            cursor = self.conn.execute("""
                 SELECT COUNT(*) as executions 
                 FROM execution_history
             """)
             exec_count = cursor.fetchone()[0]
-            return {
-                'total_quotes': row[0],
-                'total_authors': row[1],
-                'total_executions': exec_count,
-                'scraped_at': datetime.now().isoformat()
-            }
+        return {
+            'total_quotes': row[0],
+            'total_authors': row[1],
+            'total_executions': exec_count,
+            'scraped_at': datetime.now().isoformat()
+        }
+    
+    def close(self):
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self.conn.close()
+        logger.info("Conexão com o banco fechada")
+    
+    def __enter__(self) -> 'DatabaseManager':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Campos exportados de Quote, lidos como tupla sem o deepcopy do asdict
+_QUOTE_FIELDS = ('text', 'author', 'tags', 'scraped_at')
+_quote_values = attrgetter(*_QUOTE_FIELDS)
+
+# Seletores CSS compilados uma única vez
+_QUOTE_SELECTOR = sv.compile('div.quote')
+_TAG_SELECTOR = sv.compile('a.tag')
+_NEXT_SELECTOR = sv.compile('li.next')
+
+def _class_xpath(axis: str, tag: str, class_name: str) -> etree.XPath:
+    """XPath que casa o token de classe, como o seletor CSS tag.classe"""
+    return etree.XPath(
+        f"{axis}::{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    )
+
+
+# XPaths compilados para extrair direto de uma árvore lxml, sem wrappers do bs4.
+# Relativos ao elemento recebido (inclusive ele mesmo), nunca à raiz do documento
+_QUOTE_XPATH = _class_xpath('descendant-or-self', 'div', 'quote')
+_TEXT_XPATH = _class_xpath('descendant', 'span', 'text')
+_AUTHOR_XPATH = _class_xpath('descendant', 'small', 'author')
+_TAGS_XPATH = _class_xpath('descendant', 'a', 'tag')
+
+# Marcador de citação: páginas sem ele (fim da paginação, erro) nem são parseadas
+# 'quote' pode ser qualquer token do atributo class ("card quote"), não só o primeiro
+_QUOTE_MARKER = re.compile(r"""class=["'][^"']*\bquote\b""")
+_QUOTE_MARKER_BYTES = re.compile(_QUOTE_MARKER.pattern.encode())
+
+def _class_re(tag: str, class_name: str) -> str:
+    """Regex da tag de abertura com o token de classe, como o seletor CSS tag.classe"""
+    return rf"""<{tag}\b[^>]*\bclass=["'](?:[^"']*\s)?{class_name}(?=[\s"'])[^>]*>"""
+
+
+# Avança sem atravessar a abertura da próxima citação: uma citação sem autor
+# não pode emprestar o autor da seguinte
+_WITHIN_QUOTE = r'(?:(?!' + _class_re('div', 'quote') + r').)*?'
+
+# Regex do caminho rápido opcional: uma varredura do HTML, sem montar DOM
+_QUOTE_RE = re.compile(
+    _class_re('div', 'quote') + _WITHIN_QUOTE
+    + _class_re('span', 'text') + '(' + _WITHIN_QUOTE + ')</span>' + _WITHIN_QUOTE
+    + _class_re('small', 'author') + '(' + _WITHIN_QUOTE + ')</small>'
+    + '(' + _WITHIN_QUOTE + ')</div>',
+    re.DOTALL
+)
+_TAG_RE = re.compile(_class_re('a', 'tag') + r'(.*?)</a>', re.DOTALL)
+
+def _is_page_node(classes) -> bool:
+    """Casa o token de classe 'quote' ou 'next', como 'div.quote' e 'li.next'
+    
+    Durante o parse o atributo ainda chega como string ("quote card"), então
+    os tokens são separados aqui; uma lista em class_ só casaria o valor exato.
+    """
+    if classes is None:
+        return False
+    tokens = classes.split() if isinstance(classes, str) else classes
+    return not {'quote', 'next'}.isdisjoint(tokens)
+
+
+# Só as subárvores usadas são construídas: as citações e o link de paginação
+PAGE_STRAINER = SoupStrainer(['div', 'li'], class_=_is_page_node)
+
+
+def _make_quote(text: str, author: str, tags: List[str]) -> Quote:
+    """Monta a Quote com a limpeza comum aos dois caminhos de extração"""
+    return Quote(
+        text=SelectorConfig.clean_text(text),
+        author=SelectorConfig.clean_author(author),
+        tags=tuple(tags),
+        scraped_at=datetime.now().isoformat()
+    )
+
 
 class QuotesScraper:
     """Scraper principal com extração dinâmica"""
@@ -288,117 +537,269 @@ class QuotesScraper:
     def __init__(self):
         self.logger = logger
         self.session = requests.Session()
+        # Pool com uma conexão por worker de _fetch_pages
+        adapter = HTTPAdapter(
+            pool_connections=ScraperConfig.MAX_WORKERS,
+            pool_maxsize=ScraperConfig.MAX_WORKERS,
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         self.screenshot_mgr = ScreenshotManager()
+        # Validadores HTTP (ETag/Last-Modified) e página parseada de cada URL,
+        # para requisições condicionais nos scrapes seguintes. No máximo
+        # ScraperConfig.MAX_CACHED_PAGES páginas ficam guardadas
+        self._cache_headers: Dict[str, Dict[str, str]] = {}
+        self._soup_cache: 'OrderedDict[str, BeautifulSoup]' = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Busca página com retry automático"""
-        for attempt in range(ScraperConfig.RETRY_ATTEMPTS):
-            try:
-                response = self.session.get(url, timeout=ScraperConfig.TIMEOUT)
-                response.raise_for_status()
-                self.logger.info(f"✓ Página carregada: {url}")
-                return BeautifulSoup(response.content, 'html.parser')
-            except requests.RequestException as e:
-                self.logger.warning(f"Tentativa {attempt + 1}/{ScraperConfig.RETRY_ATTEMPTS} falhou: {e}")
-                time.sleep(2 ** attempt)
+        """Busca página com retry automático
+        
+        Envia If-None-Match/If-Modified-Since quando a URL já foi vista; um
+        304 devolve a página parseada anteriormente, sem baixar nem parsear.
+        """
+        try:
+            return self._get_page(url)
+        except requests.RequestException:
+            self.logger.error(f"Falha ao carregar {url}")
+            return None
+    
+    @retry(requests.RequestException)
+    def _get_page(self, url: str) -> BeautifulSoup:
+        """Uma tentativa de busca da página (o retry fica no decorator)"""
+        response = self.session.get(
+            url,
+            timeout=ScraperConfig.TIMEOUT,
+            headers=self._cache_headers.get(url)
+        )
+        if response.status_code == 304 and url in self._soup_cache:
+            self.logger.info(f"✓ Página inalterada (304): {url}")
+            return self._soup_cache[url]
+        response.raise_for_status()
+        self.logger.info(f"✓ Página carregada: {url}")
+        if _QUOTE_MARKER_BYTES.search(response.content):
+            soup = BeautifulSoup(
+                response.content, ScraperConfig.HTML_PARSER, parse_only=PAGE_STRAINER
+            )
+        else:
+            soup = BeautifulSoup(b'', ScraperConfig.HTML_PARSER)
+        self._remember_page(url, response, soup)
+        return soup
+    
+    def _remember_page(self, url: str, response: requests.Response, soup: BeautifulSoup):
+        """Guarda os validadores de cache da resposta junto com a página parseada"""
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
         
-        self.logger.error(f"Falha ao carregar {url}")
-        return None
+        if not validators:
+            return
+        with self._cache_lock:
+            self._cache_headers[url] = validators
+            self._soup_cache[url] = soup
+            self._soup_cache.move_to_end(url)
+            # Descarta a página menos recente junto com seus validadores
+            while len(self._soup_cache) > ScraperConfig.MAX_CACHED_PAGES:
+                old_url, _ = self._soup_cache.popitem(last=False)
+                self._cache_headers.pop(old_url, None)
     
-    def extract_quotes_dynamic(self, soup: BeautifulSoup) -> List[Quote]:
-        """Extrai citações sem fixar XPath"""
-        quotes = []
-        quote_containers = soup.select('[class*="quote"]')
+    def clear_cache(self):
+        """Esquece páginas e validadores guardados (próximas buscas são completas)"""
+        with self._cache_lock:
+            self._cache_headers.clear()
+            self._soup_cache.clear()
+    
+    def extract_quotes_dynamic(self, soup) -> List[Quote]:
+        """Extrai citações pelas classes exatas do site
+        
+        Aceita um BeautifulSoup, uma árvore lxml (HtmlElement), extraída
+        pelos XPaths compilados, ou o HTML bruto, repassado a
+        extract_quotes_fast.
+        """
+        if isinstance(soup, (str, bytes)):
+            return self.extract_quotes_fast(soup)
+        if isinstance(soup, HtmlElement):
+            quotes = self._extract_quotes_xpath(soup)
+        else:
+            quotes = self._extract_quotes_soup(soup)
+        
+        self.logger.info(f"Extraídas {len(quotes)} citações da página")
+        return quotes
+    
+    def extract_quotes_fast(self, html) -> List[Quote]:
+        """Extrai citações do HTML bruto sem construir um BeautifulSoup
+        
+        Usa o parser C do selectolax quando instalado; senão, a árvore
+        lxml com os XPaths compilados. Com USE_REGEX_FAST_PATH, uma única
+        varredura por regex, sem parser algum.
+        """
+        marker = _QUOTE_MARKER_BYTES if isinstance(html, bytes) else _QUOTE_MARKER
+        if not marker.search(html):
+            quotes = []
+        elif ScraperConfig.USE_REGEX_FAST_PATH:
+            quotes = self._extract_quotes_regex(html)
+        elif SELECTOLAX_AVAILABLE:
+            quotes = self._extract_quotes_selectolax(html)
+        else:
+            quotes = self._extract_quotes_xpath(lxml_html.fromstring(html))
         
-        for container in quote_containers:
-            text_elem = container.select_one('[class*="text"]')
-            author_elem = container.select_one('[class*="author"]')
-            tags_elem = container.select('[class*="tag"]')
+        self.logger.info(f"Extraídas {len(quotes)} citações da página")
+        return quotes
+    
+    @staticmethod
+    def _extract_quotes_regex(html) -> List[Quote]:
+        """Extração via regex compilada (assume o markup do quotes.toscrape.com)"""
+        if isinstance(html, bytes):
+            html = html.decode('utf-8', errors='replace')
+        return [
+            _make_quote(
+                unescape(text).strip(),
+                unescape(author).strip(),
+                [unescape(tag).strip() for tag in _TAG_RE.findall(rest)]
+            )
+            for text, author, rest in _QUOTE_RE.findall(html)
+        ]
+    
+    @staticmethod
+    def _extract_quotes_selectolax(html) -> List[Quote]:
+        """Extração via seletores CSS do selectolax (backend lexbor)"""
+        quotes = []
+        for container in LexborHTMLParser(html).css('div.quote'):
+            text_elem = container.css_first('span.text')
+            author_elem = container.css_first('small.author')
+            if text_elem is None or author_elem is None:
+                continue
+            quotes.append(_make_quote(
+                text_elem.text(strip=True),
+                author_elem.text(strip=True),
+                [tag.text(strip=True) for tag in container.css('a.tag')]
+            ))
+        return quotes
+    
+    @staticmethod
+    def _extract_quotes_soup(soup: BeautifulSoup) -> List[Quote]:
+        """Extração via seletores CSS do bs4"""
+        quotes = []
+        for container in _QUOTE_SELECTOR.select(soup):
+            text_elem = container.find('span', class_='text')
+            author_elem = container.find('small', class_='author')
             
             try:
-                text = text_elem.get_text(strip=True).replace('"', '').replace('"', '')
-                author = author_elem.get_text(strip=True).replace('by ', '')
-                tags = [tag.get_text(strip=True) for tag in tags_elem] if tags_elem else []
-                
-                quote = Quote(
-                    text=text,
-                    author=author,
-                    tags=tags,
-                    scraped_at=datetime.now().isoformat()
-                )
-                quotes.append(quote)
+                quotes.append(_make_quote(
+                    text_elem.get_text(strip=True),
+                    author_elem.get_text(strip=True),
+                    [tag.get_text(strip=True) for tag in _TAG_SELECTOR.select(container)]
+                ))
             except AttributeError:
                 continue
-        
-        self.logger.info(f"Extraídas {len(quotes)} citações da página")
         return quotes
     
-    def scrape_all_pages(self, take_screenshot: bool = True, max_pages: int = None) -> tuple:
+    @staticmethod
+    def _extract_quotes_xpath(root: HtmlElement) -> List[Quote]:
+        """Extração via XPath direto na árvore lxml"""
+        quotes = []
+        for container in _QUOTE_XPATH(root):
+            try:
+                quotes.append(_make_quote(
+                    _TEXT_XPATH(container)[0].text_content().strip(),
+                    _AUTHOR_XPATH(container)[0].text_content().strip(),
+                    [tag.text_content().strip() for tag in _TAGS_XPATH(container)]
+                ))
+            except IndexError:
+                continue
+        return quotes
+    
+    def scrape_all_pages(self, take_screenshot: bool = True, max_pages: int = None,
+                         reuse_today: bool = False) -> tuple:
         """Scraping de todas as páginas e retorna (quotes, screenshot_path)
         
         Args:
             take_screenshot: Se deve capturar screenshot da primeira página
             max_pages: Número máximo de páginas a serem extraídas (None = usa ScraperConfig.MAX_PAGES)
+            reuse_today: Reaproveita o screenshot de hoje, se existir, em vez de abrir o navegador
         """
         if max_pages is None:
             max_pages = ScraperConfig.MAX_PAGES
             
         all_quotes = []
-        page_num = 1
+        pages_scraped = 0
         screenshot_path = None
         
         try:
             first_url = f"{ScraperConfig.BASE_URL}/page/1/"
-            screenshot_path = self.screenshot_mgr.take_screenshot(first_url, 0) if take_screenshot else None
+            screenshot_path = (
+                self.screenshot_mgr.take_screenshot(first_url, 0, reuse_today=reuse_today)
+                if take_screenshot else None
+            )
         except Exception as e:
             self.logger.warning(f"Erro ao capturar screenshot: {e}")
         
-        while page_num <= max_pages:
-            url = f"{ScraperConfig.BASE_URL}/page/{page_num}/"
-            soup = self.fetch_page(url)
+        for soup in self._fetch_pages(max_pages):
+            if soup is None:
+                self.logger.info("Fim da paginação alcançado")
+                break
             
-            try:
-                quotes = self.extract_quotes_dynamic(soup)
-                all_quotes.extend(quotes)
-                
-                next_btn = soup.select_one('li.next')
-                page_num += 1
-                
-                if page_num > max_pages:
-                    self.logger.info(f"Limite de {max_pages} páginas atingido")
-                    break
-            except (AttributeError, TypeError):
+            all_quotes.extend(self.extract_quotes_dynamic(soup))
+            pages_scraped += 1
+            
+            if _NEXT_SELECTOR.select_one(soup) is None:
                 self.logger.info("Fim da paginação alcançado")
                 break
+        else:
+            self.logger.info(f"Limite de {max_pages} páginas atingido")
         
-        self.logger.info(f"Total de {len(all_quotes)} citações extraídas de {page_num - 1} páginas")
+        self.logger.info(f"Total de {len(all_quotes)} citações extraídas de {pages_scraped} páginas")
         return all_quotes, screenshot_path
     
-    def save_json(self, quotes: List[Quote], filename: str = "quotes.json"):
-        """Salva em JSON"""
-        filepath = ScraperConfig.OUTPUT_DIR / filename
-        data = [asdict(q) for q in quotes]
+    def _fetch_pages(self, max_pages: int):
+        """Busca as páginas em lotes concorrentes e as devolve em ordem
+        
+        A rede domina o tempo de cada página, então cada lote de
+        ScraperConfig.MAX_WORKERS páginas é buscado em paralelo; o lote
+        seguinte só é disparado se o consumidor continuar iterando.
+        """
+        workers = ScraperConfig.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(1, max_pages + 1, workers):
+                stop = min(start + workers, max_pages + 1)
+                urls = [f"{ScraperConfig.BASE_URL}/page/{n}/" for n in range(start, stop)]
+                yield from executor.map(self.fetch_page, urls)
+    
+    def save_json(self, quotes: List[Quote], filename: str = "quotes.json",
+                  output_dir: Optional[Path] = None):
+        """Salva em JSON, uma citação por vez (sem lista intermediária)"""
+        filepath = (output_dir or ScraperConfig.OUTPUT_DIR) / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(b'[')
+            for i, values in enumerate(map(_quote_values, quotes)):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_json_bytes(dict(zip(_QUOTE_FIELDS, values))))
+            f.write(b'\n]\n')
         
         self.logger.info(f"Salvo: {filepath}")
         return filepath
     
-    def save_csv(self, quotes: List[Quote], filename: str = "quotes.csv"):
+    def save_csv(self, quotes: List[Quote], filename: str = "quotes.csv",
+                 output_dir: Optional[Path] = None):
         """Salva em CSV"""
-        filepath = ScraperConfig.OUTPUT_DIR / filename
+        filepath = (output_dir or ScraperConfig.OUTPUT_DIR) / filename
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['text', 'author', 'tags', 'scraped_at'])
-            writer.writeheader()
-            for quote in quotes:
-                row = asdict(quote)
-                row['tags'] = '|'.join(row['tags'])
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(_QUOTE_FIELDS)
+            writer.writerows(
+                (text, author, '|'.join(tags), scraped_at)
+                for text, author, tags, scraped_at in map(_quote_values, quotes)
+            )
         
         self.logger.info(f"Salvo: {filepath}")
         return filepath
@@ -410,17 +811,67 @@ class QuotesScraper:
         except (AttributeError, Exception):
             pass
 
+class _Column(list):
+    """Coluna da QuoteTable: lista comum, com máscaras via eq/ne como na Series
+    
+    == continua sendo a igualdade de list; sobrescrevê-lo para devolver
+    uma máscara (sempre verdadeira) quebraria asserts e ifs.
+    """
+    
+    def eq(self, other) -> List[bool]:
+        return [value == other for value in self]
+    
+    def ne(self, other) -> List[bool]:
+        return [value != other for value in self]
+
+
+class QuoteTable:
+    """Tabela leve (dict de listas) usada no lugar do DataFrame sem pandas
+    
+    Cobre o básico: len(), columns, shape, coluna por nome e filtro por
+    máscara booleana (table[table['author'].eq('X')]).
+    """
+    
+    def __init__(self, data: Dict[str, list]):
+        self._data = {name: _Column(values) for name, values in data.items()}
+    
+    @property
+    def columns(self) -> List[str]:
+        return list(self._data)
+    
+    @property
+    def shape(self) -> tuple:
+        return (len(self), len(self._data))
+    
+    def __len__(self) -> int:
+        return len(next(iter(self._data.values()), ()))
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._data[key]
+        return QuoteTable({
+            name: [value for value, keep in zip(values, key) if keep]
+            for name, values in self._data.items()
+        })
+
+
 class DataFrameAnalyzer:
     """Análise com Pandas DataFrame"""
     
     @staticmethod
-    def create_dataframe(quotes_data: List[Dict]) -> 'pd.DataFrame':
-        """Cria DataFrame dos dados"""
+    def create_dataframe(quotes_data) -> 'pd.DataFrame':
+        """Cria DataFrame dos dados (lista de dicts ou DataFrame lido do banco)
+        
+        Sem pandas, devolve uma QuoteTable com as mesmas colunas.
+        """
+        if not PANDAS_AVAILABLE:
+            return DataFrameAnalyzer._create_table(quotes_data)
         try:
             df = pd.DataFrame(quotes_data)
             
-            df['tags'] = df['tags'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-            df['tag_count'] = df['tags'].apply(len)
+            # Decodificar JSON não é vetorizável: list-comp evita o overhead do .apply
+            df['tags'] = [_decode_tags(tags) for tags in df['tags'].values]
+            df['tag_count'] = df['tags'].map(len)
             df['text_length'] = df['text'].str.len()
             df['scraped_at'] = pd.to_datetime(df['scraped_at'])
             
@@ -430,9 +881,27 @@ class DataFrameAnalyzer:
             logger.warning(f"Pandas não disponível ou erro: {e}")
             return None
     
+    @staticmethod
+    def _create_table(quotes_data: List[Dict]) -> QuoteTable:
+        """Monta a QuoteTable a partir dos dicts do banco"""
+        rows = list(quotes_data)
+        data = {name: [row[name] for row in rows] for name in (rows[0] if rows else ())}
+        if rows:
+            data['tags'] = [_decode_tags(tags) for tags in data['tags']]
+            data['tag_count'] = [len(tags) for tags in data['tags']]
+            data['text_length'] = [len(text) for text in data['text']]
+            data['scraped_at'] = [datetime.fromisoformat(ts) for ts in data['scraped_at']]
+        
+        table = QuoteTable(data)
+        logger.info(f"Tabela criada com {len(table)} linhas (sem pandas)")
+        return table
+    
     @staticmethod
     def display_dataframe(df: 'pd.DataFrame'):
         """Exibe DataFrame formatado"""
+        if isinstance(df, QuoteTable):
+            DataFrameAnalyzer._display_table(df)
+            return
         try:
             print("\n" + "="*80)
             print("DATAFRAME - VISUALIZAÇÃO DOS DADOS")
@@ -462,33 +931,99 @@ class DataFrameAnalyzer:
             print(f"Erro ao exibir DataFrame: {e}")
     
     @staticmethod
-    def save_analysis(df: 'pd.DataFrame', filename: str = "analysis.csv"):
+    def _display_table(table: QuoteTable):
+        """Exibe a QuoteTable com resumos em Python puro (sem pandas)"""
+        print("\n" + "="*80)
+        print("TABELA - VISUALIZAÇÃO DOS DADOS")
+        print("="*80)
+        
+        print(f"\nDimensões: {table.shape[0]} linhas x {table.shape[1]} colunas\n")
+        if not len(table):
+            return
+        
+        print("Primeiras 10 citações:")
+        print("-"*80)
+        rows = zip(table['author'], table['text'], table['tag_count'], table['text_length'])
+        for i, (author, text, tag_count, text_length) in enumerate(rows):
+            if i == 10:
+                break
+            print(f"{i:2d}  {author:25.25s} {text:50.50s} {tag_count:3d} {text_length:5d}")
+        
+        print("\n" + "="*80)
+        print("ESTATÍSTICAS DESCRITIVAS")
+        print("="*80)
+        for column in ('text_length', 'tag_count'):
+            values = table[column]
+            print(f"{column:12s} média={statistics.fmean(values):8.2f} "
+                  f"mín={min(values):5d} máx={max(values):5d}")
+        
+        print("\n" + "="*80)
+        print("TOP 10 AUTORES")
+        print("="*80)
+        top_authors = Counter(table['author']).most_common(10)
+        for i, (author, count) in enumerate(top_authors, 1):
+            print(f"{i:2d}. {author:30s} - {count:3d} citações")
+        
+        print("\n" + "="*80)
+    
+    @staticmethod
+    def save_analysis(df: 'pd.DataFrame', filename: str = "analysis.csv",
+                      output_dir: Optional[Path] = None):
         """Salva análise em CSV"""
         try:
-            filepath = ScraperConfig.OUTPUT_DIR / filename
-            
-            analysis = df.groupby('author').agg({
-                'text': 'count',
-                'text_length': 'mean',
-                'tag_count': 'mean'
-            }).rename(columns={
-                'text': 'quote_count',
-                'text_length': 'avg_text_length',
-                'tag_count': 'avg_tags'
-            }).sort_values('quote_count', ascending=False).head(20)
-            
-            analysis.to_csv(filepath, encoding='utf-8')
+            filepath = (output_dir or ScraperConfig.OUTPUT_DIR) / filename
+            
+            if isinstance(df, QuoteTable):
+                DataFrameAnalyzer._save_table_analysis(df, filepath)
+            else:
+                analysis = df.groupby('author').agg({
+                    'text': 'count',
+                    'text_length': 'mean',
+                    'tag_count': 'mean'
+                }).rename(columns={
+                    'text': 'quote_count',
+                    'text_length': 'avg_text_length',
+                    'tag_count': 'avg_tags'
+                }).sort_values('quote_count', ascending=False).head(20)
+                
+                analysis.to_csv(filepath, encoding='utf-8')
             logger.info(f"Análise salva: {filepath}")
         except Exception as e:
             logger.error(f"Erro ao salvar análise: {e}")
+    
+    @staticmethod
+    def _save_table_analysis(table: QuoteTable, filepath: Path):
+        """Mesma análise por autor do save_analysis, em Python puro"""
+        by_author: Dict[str, List[tuple]] = {}
+        for author, text_length, tag_count in zip(
+            table['author'], table['text_length'], table['tag_count']
+        ):
+            by_author.setdefault(author, []).append((text_length, tag_count))
+        
+        ranking = sorted(by_author.items(), key=lambda item: len(item[1]), reverse=True)[:20]
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(('author', 'quote_count', 'avg_text_length', 'avg_tags'))
+            writer.writerows(
+                (author, len(values),
+                 statistics.fmean(length for length, _ in values),
+                 statistics.fmean(tags for _, tags in values))
+                for author, values in ranking
+            )
 
 
 class TaskScheduler:
-    """Agendador de tarefas"""
+    """Agendador de tarefas (threading.Timer por execução agendada)"""
     
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    def __init__(self, db: Optional[DatabaseManager] = None,
+                 scraper: Optional['QuotesScraper'] = None):
+        self.timers: Dict[str, threading.Timer] = {}
+        self.running = False
         self.scheduled_jobs = []
+        # Compartilha banco e scraper (e seu WebDriver) com a CLI em vez
+        # de recriá-los a cada job
+        self.db = db
+        self.scraper = scraper
     
     def schedule_scrape(self, date_str: str, time_str: str):
         """Agenda scrape para data/hora específica"""
@@ -497,15 +1032,24 @@ class TaskScheduler:
             hour, minute = map(int, time_str.split(':'))
             run_date = datetime(year, month, day, hour, minute)
             
-            job = self.scheduler.add_job(
-                self.run_scrape_job,
-                'date',
-                run_date=run_date,
-                id=f'scrape_{run_date.strftime("%Y%m%d_%H%M%S")}'
-            )
+            delay = (run_date - datetime.now()).total_seconds()
+            if delay <= 0:
+                raise ValueError("data/hora já passou")
+            if delay > threading.TIMEOUT_MAX:
+                raise ValueError("data/hora distante demais")
+            
+            job_id = f'scrape_{run_date.strftime("%Y%m%d_%H%M%S")}'
+            if job_id in self.timers:
+                raise ValueError(f"já existe um scrape agendado para {run_date}")
+            
+            timer = threading.Timer(delay, self.run_scrape_job)
+            timer.daemon = True
+            self.timers[job_id] = timer
+            if self.running:
+                timer.start()
             
             self.scheduled_jobs.append({
-                'job_id': job.id,
+                'job_id': job_id,
                 'run_date': run_date.isoformat(),
                 'status': 'scheduled'
             })
@@ -522,10 +1066,13 @@ class TaskScheduler:
         logger.info("Iniciando scrape agendado...")
         
         try:
-            scraper = QuotesScraper()
-            db = DatabaseManager()
+            if self.scraper is None:
+                self.scraper = QuotesScraper()
+            if self.db is None:
+                self.db = DatabaseManager()
+            scraper, db = self.scraper, self.db
             
-            quotes, screenshot = scraper.scrape_all_pages(take_screenshot=True)
+            quotes, screenshot = scraper.scrape_all_pages(take_screenshot=True, reuse_today=True)
             inserted = db.insert_quotes(quotes)
             
             db.log_execution(
@@ -545,20 +1092,46 @@ class TaskScheduler:
         return self.scheduled_jobs
     
     def start(self):
-        """Inicia scheduler"""
-        try:
-            self.scheduler.start()
-            logger.info("Scheduler iniciado")
-        except Exception as e:
-            logger.warning(f"Scheduler já em execução: {e}")
+        """Inicia scheduler (dispara os timers agendados antes do start)"""
+        if self.running:
+            logger.warning("Scheduler já em execução")
+            return
+        self.running = True
+        for timer in self.timers.values():
+            if not timer.is_alive() and not timer.finished.is_set():
+                timer.start()
+        logger.info("Scheduler iniciado")
     
     def stop(self):
-        """Para scheduler"""
-        try:
-            self.scheduler.shutdown()
-            logger.info("Scheduler parado")
-        except Exception as e:
-            logger.warning(f"Erro ao parar scheduler: {e}")
+        """Para scheduler, cancelando as execuções pendentes
+        
+        cancel() não interrompe um job que já disparou, então espera os
+        timers ainda vivos terminarem: só depois a CLI pode fechar o banco.
+        """
+        for timer in self.timers.values():
+            timer.cancel()
+        current = threading.current_thread()
+        for timer in self.timers.values():
+            if timer.is_alive() and timer is not current:
+                timer.join()
+        self.running = False
+        logger.info("Scheduler parado")
+
+
+def load_quotes_data(db: DatabaseManager):
+    """Dados para o DataFrameAnalyzer: DataFrame lido do SQL ou, sem pandas, dicts"""
+    return db.get_all_quotes_df() if PANDAS_AVAILABLE else db.get_all_quotes()
+
+
+def load_quotes(db: DatabaseManager) -> List[Quote]:
+    """Reconstrói as citações do banco como objetos Quote"""
+    return [Quote(
+        text=q['text'],
+        author=q['author'],
+        tags=tuple(_json_loads(q['tags'])),
+        scraped_at=q['scraped_at']
+    ) for q in db.get_all_quotes()]
+
 
 def main():
     """Interface CLI"""
@@ -568,7 +1141,7 @@ def main():
     
     scraper = QuotesScraper()
     db = DatabaseManager()
-    scheduler = TaskScheduler()
+    scheduler = TaskScheduler(db, scraper)
     scheduler.start()
     
     try:
@@ -611,40 +1184,28 @@ def main():
                     print(f"  {k}: {v}")
             
             elif choice == '3':
-                quotes_data = db.get_all_quotes()
-                quotes = [Quote(
-                    text=q['text'],
-                    author=q['author'],
-                    tags=json.loads(q['tags']),
-                    scraped_at=q['scraped_at']
-                ) for q in quotes_data]
-                scraper.save_csv(quotes)
+                db.export_csv(ScraperConfig.OUTPUT_DIR / "quotes.csv")
                 print("✓ Exportado para CSV!")
             
             elif choice == '4':
-                quotes_data = db.get_all_quotes()
-                quotes = [Quote(
-                    text=q['text'],
-                    author=q['author'],
-                    tags=json.loads(q['tags']),
-                    scraped_at=q['scraped_at']
-                ) for q in quotes_data]
-                scraper.save_json(quotes)
+                if PANDAS_AVAILABLE:
+                    db.export_json(ScraperConfig.OUTPUT_DIR / "quotes.json")
+                else:
+                    scraper.save_json(load_quotes(db))
                 print("✓ Exportado para JSON!")
             
             elif choice == '5':
                 try:
-                    quotes_data = db.get_all_quotes()
+                    quotes_data = load_quotes_data(db)
                     df = DataFrameAnalyzer.create_dataframe(quotes_data)
                     DataFrameAnalyzer.display_dataframe(df)
                     input("\nPressione ENTER para continuar...")
                 except Exception as e:
                     print(f"\n Erro: {e}")
-                    print("   Certifique-se de que o Pandas está instalado: pip install pandas")
             
             elif choice == '6':
                 try:
-                    quotes_data = db.get_all_quotes()
+                    quotes_data = load_quotes_data(db)
                     df = DataFrameAnalyzer.create_dataframe(quotes_data)
                     DataFrameAnalyzer.save_analysis(df)
                     print("✓ Análise salva em analysis.csv!")
@@ -699,6 +1260,7 @@ def main():
                 print("\nEncerrando...")
                 scheduler.stop()
                 scraper.screenshot_mgr.close()
+                db.close()
                 print("Até logo!")
                 break
             
@@ -709,10 +1271,12 @@ def main():
         print("\n\nInterrompido pelo usuário")
         scheduler.stop()
         scraper.screenshot_mgr.close()
+        db.close()
     except Exception as e:
         logger.error(f"Erro fatal: {e}")
         scheduler.stop()
         scraper.screenshot_mgr.close()
+        db.close()
 
 
 if __name__ == "__main__":
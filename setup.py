@@ -36,6 +36,7 @@ setup(
             "pytest>=8.0",
             "pytest-cov>=5.0",
             "pytest-mock>=3.0",
+            "pytest-xdist>=3.0",
             "black>=24.0",
             "flake8>=7.0",
             "mypy>=1.0",
@@ -44,6 +45,7 @@ setup(
             "pytest>=8.0",
             "pytest-cov>=5.0",
             "pytest-mock>=3.0",
+            "pytest-xdist>=3.0",
         ],
     },
     entry_points={
@@ -1,12 +1,11 @@
 import pytest
-import tempfile
-import sqlite3
-from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, time as dt_time
+from dataclasses import FrozenInstanceError, asdict, fields
 import json
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from scraper import (
@@ -16,36 +15,26 @@ from scraper import (
     QuotesScraper,
     DataFrameAnalyzer,
     ScreenshotManager,
-    TaskScheduler
+    TaskScheduler,
+    QuoteTable,
+    load_quotes_data,
+    PAGE_STRAINER,
+    SELECTOLAX_AVAILABLE
 )
 from bs4 import BeautifulSoup
+import lxml.html
 import requests
 
+import config
+
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path_factory):
     """Cria banco de dados temporário para testes"""
-    import gc
-    temp_dir = tempfile.TemporaryDirectory()
-    db_path = Path(temp_dir.name) / "test_quotes.db"
-    
-    yield db_path
-    
-    gc.collect()
-    
-    try:
-        import time
-        time.sleep(0.1)
-        
-        try:
-            temp_dir.cleanup()
-        except PermissionError:
-            pass
-    except Exception:
-        pass
+    return tmp_path_factory.mktemp("db") / "test_quotes.db"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_quote():
     """Cria uma Quote de exemplo"""
     return Quote(
@@ -56,7 +45,13 @@ def sample_quote():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_quote_dict(sample_quote):
+    """sample_quote convertida para dict uma única vez por módulo"""
+    return asdict(sample_quote)
+
+
+@pytest.fixture(scope="module")
 def sample_html():
     """HTML real do site quotes.toscrape.com"""
     return """
@@ -76,7 +71,7 @@ def sample_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_multiple():
     """HTML com múltiplas quotes"""
     return """
@@ -98,6 +93,42 @@ def sample_html_multiple():
     """
 
 
+@pytest.fixture(scope="module")
+def sample_soup(sample_html):
+    """Soup do sample_html, parseado uma única vez por módulo"""
+    return BeautifulSoup(sample_html, 'lxml', parse_only=PAGE_STRAINER)
+
+
+@pytest.fixture(scope="module")
+def sample_soup_multiple(sample_html_multiple):
+    """Soup do sample_html_multiple, parseado uma única vez por módulo"""
+    return BeautifulSoup(sample_html_multiple, 'lxml', parse_only=PAGE_STRAINER)
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    """QuotesScraper compartilhado pelos testes do módulo"""
+    scraper = QuotesScraper()
+    yield scraper
+    scraper.session.close()
+
+
+@pytest.fixture(scope="module")
+def shared_db(tmp_path_factory):
+    """DatabaseManager aberto uma única vez por módulo"""
+    db = DatabaseManager(tmp_path_factory.mktemp("db") / "test_quotes.db")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db(shared_db):
+    """Banco compartilhado, esvaziado antes de cada teste"""
+    shared_db.conn.execute("DELETE FROM quotes")
+    shared_db.conn.execute("DELETE FROM execution_history")
+    return shared_db
+
+
 class TestQuoteModel:
     """Testa a classe Quote real"""
     
@@ -108,88 +139,295 @@ class TestQuoteModel:
         assert len(sample_quote.tags) == 3
         assert "change" in sample_quote.tags
     
-    def test_quote_dataclass_fields(self, sample_quote):
+    def test_quote_dataclass_fields(self):
         """Testa que Quote tem todos os campos necessários"""
-        assert hasattr(sample_quote, 'text')
-        assert hasattr(sample_quote, 'author')
-        assert hasattr(sample_quote, 'tags')
-        assert hasattr(sample_quote, 'scraped_at')
+        names = {f.name for f in fields(Quote)}
+        assert {'text', 'author', 'tags', 'scraped_at'} <= names
     
-    def test_quote_serialization(self, sample_quote):
-        """Testa conversão para dict"""
-        from dataclasses import asdict
-        quote_dict = asdict(sample_quote)
+    def test_quote_is_slotted_and_frozen(self, sample_quote):
+        """Testa que Quote não tem __dict__ e não aceita reatribuição"""
+        assert not hasattr(sample_quote, '__dict__')
+        with pytest.raises(FrozenInstanceError):
+            sample_quote.author = "Outro"
+    
+    def test_quote_is_hashable_with_tuple_tags(self, sample_quote):
+        """Testa que as tags viram tupla e a Quote pode ser usada em sets"""
+        duplicate = Quote(sample_quote.text, sample_quote.author,
+                          list(sample_quote.tags), sample_quote.scraped_at)
         
-        assert 'text' in quote_dict
-        assert 'author' in quote_dict
-        assert 'tags' in quote_dict
-        assert quote_dict['author'] == "Albert Einstein"
+        assert isinstance(sample_quote.tags, tuple)
+        assert len({sample_quote, duplicate}) == 1
+    
+    def test_quote_serialization(self, sample_quote_dict):
+        """Testa conversão para dict"""
+        assert 'text' in sample_quote_dict
+        assert 'author' in sample_quote_dict
+        assert 'tags' in sample_quote_dict
+        assert sample_quote_dict['author'] == "Albert Einstein"
 
 
 class TestQuotesScraper:
     """Testa a classe QuotesScraper real"""
     
-    def test_scraper_initialization(self):
+    def test_scraper_initialization(self, scraper):
         """Testa criação do scraper"""
-        scraper = QuotesScraper()
         assert scraper is not None
         assert hasattr(scraper, 'session')
         assert hasattr(scraper, 'screenshot_mgr')
     
-    def test_extract_quotes_dynamic(self, sample_html):
+    def test_extract_quotes_dynamic(self, scraper, sample_soup):
         """Testa extração REAL de quotes do HTML"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup(sample_html, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
+        quotes = scraper.extract_quotes_dynamic(sample_soup)
         
         assert len(quotes) == 1
         assert quotes[0].author == "Albert Einstein"
         assert "change" in quotes[0].tags
+        assert quotes[0].tags == ("change", "deep-thoughts", "thinking")
     
-    def test_extract_multiple_quotes(self, sample_html_multiple):
+    def test_extract_multiple_quotes(self, scraper, sample_soup_multiple):
         """Testa extração de múltiplas quotes"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup(sample_html_multiple, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
+        quotes = scraper.extract_quotes_dynamic(sample_soup_multiple)
         
         assert len(quotes) == 2
         assert quotes[0].author == "Author 1"
         assert quotes[1].author == "Author 2"
     
+    def test_extract_quotes_from_lxml_tree(self, scraper, sample_html, sample_soup):
+        """Testa que o caminho XPath (árvore lxml) extrai o mesmo que o bs4"""
+        root = lxml.html.fromstring(sample_html)
+        
+        from_tree = scraper.extract_quotes_dynamic(root)
+        from_soup = scraper.extract_quotes_dynamic(sample_soup)
+        
+        assert len(from_tree) == 1
+        assert [(q.text, q.author, q.tags) for q in from_tree] == \
+            [(q.text, q.author, q.tags) for q in from_soup]
+    
+    @pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax não instalado")
+    def test_extraction_paths_agree_on_class_tokens(self, scraper):
+        """Testa que soup, selectolax e XPath casam classes compostas igualmente"""
+        html = """
+        <section id="outside">
+            <div class="quote">
+                <span class="text">"Outside"</span>
+                <small class="author">Author 0</small>
+            </div>
+        </section>
+        <section id="page">
+            <div class="quote card">
+                <span class="text big">"Multi class"</span>
+                <small class="author  name">Author 1</small>
+                <a class="tag link">tag1</a>
+            </div>
+        </section>
+        """
+        soup = BeautifulSoup(html, 'lxml', parse_only=PAGE_STRAINER)
+        root = lxml.html.fromstring(html)
+        
+        results = [
+            scraper._extract_quotes_soup(soup),
+            scraper._extract_quotes_selectolax(html),
+            scraper._extract_quotes_xpath(root),
+        ]
+        
+        expected = [("Outside", "Author 0", ()), ("Multi class", "Author 1", ("tag1",))]
+        for quotes in results:
+            assert [(q.text, q.author, q.tags) for q in quotes] == expected
+        
+        page = root.get_element_by_id('page')
+        assert [q.author for q in scraper._extract_quotes_xpath(page)] == ["Author 1"]
+    
+    def test_extract_quotes_fast(self, scraper, sample_html_multiple, sample_soup_multiple):
+        """Testa que a extração do HTML bruto bate com a do bs4"""
+        fast = scraper.extract_quotes_fast(sample_html_multiple)
+        from_soup = scraper.extract_quotes_dynamic(sample_soup_multiple)
+        
+        assert [(q.text, q.author, q.tags) for q in fast] == \
+            [(q.text, q.author, q.tags) for q in from_soup]
+    
+    def test_extract_quotes_regex_fast_path(self, scraper, sample_html, sample_html_multiple):
+        """Testa o caminho rápido por regex habilitado em ScraperConfig"""
+        with patch.object(ScraperConfig, 'USE_REGEX_FAST_PATH', True):
+            single = scraper.extract_quotes_fast(sample_html)
+            multiple = scraper.extract_quotes_fast(sample_html_multiple)
+        
+        assert single[0].author == "Albert Einstein"
+        assert single[0].text.startswith("The world as we have created it")
+        assert single[0].tags == ("change", "deep-thoughts", "thinking")
+        assert [(q.text, q.author, q.tags) for q in multiple] == [
+            ("Quote 1", "Author 1", ("tag1",)),
+            ("Quote 2", "Author 2", ("tag2", "tag3")),
+        ]
+    
+    @pytest.mark.parametrize("html", [
+        """
+        <div class="quote card"><span class="text big">"Multi class"</span>
+        <small class="author  name">Author 1</small>
+        <div class="tags"><a class="tag link" href="#">tag1</a></div></div>
+        """,
+        """
+        <div class="quote"><span class="text">"A"</span></div>
+        <div class="quote"><span class="text">"B"</span>
+        <small class="author">Y</small></div>
+        """,
+    ], ids=["multi-class", "missing-author"])
+    def test_extract_quotes_regex_matches_soup(self, scraper, html):
+        """Testa que o caminho por regex casa tokens de classe e não atravessa citações"""
+        soup = BeautifulSoup(html, 'lxml', parse_only=PAGE_STRAINER)
+        
+        from_regex = scraper._extract_quotes_regex(html)
+        from_soup = scraper._extract_quotes_soup(soup)
+        
+        assert len(from_regex) == 1
+        assert [(q.text, q.author, q.tags) for q in from_regex] == \
+            [(q.text, q.author, q.tags) for q in from_soup]
+    
+    def test_extract_quotes_fast_without_selectolax(self, scraper, sample_html):
+        """Testa o fallback lxml quando o selectolax não está instalado"""
+        with patch('scraper.SELECTOLAX_AVAILABLE', False):
+            quotes = scraper.extract_quotes_dynamic(sample_html)
+        
+        assert len(quotes) == 1
+        assert quotes[0].author == "Albert Einstein"
+        assert quotes[0].tags == ("change", "deep-thoughts", "thinking")
+    
     @patch('scraper.requests.Session.get')
-    def test_fetch_page_success(self, mock_get):
+    def test_fetch_page_success(self, mock_get, scraper):
         """Testa busca de página com sucesso"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b'<html><body>Test</body></html>'
+        mock_response.content = b'<html><body><div class="quote">Test</div></body></html>'
         mock_get.return_value = mock_response
         
-        scraper = QuotesScraper()
         soup = scraper.fetch_page("http://test.com")
         
         assert soup is not None
-        assert soup.find('body') is not None
+        assert soup.select_one('div.quote') is not None
+    
+    @patch('scraper.requests.Session.get')
+    def test_fetch_page_keeps_multi_class_nodes(self, mock_get, scraper):
+        """Testa que o SoupStrainer mantém div.quote e li.next com outras classes"""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"""
+            <div class="quote card"><span class="text">"Q"</span>
+            <small class="author">A</small></div>
+            <ul><li class="next pager"><a href="#">Next</a></li></ul>
+        """)
+        
+        soup = scraper.fetch_page("http://test.com/multi-class/")
+        
+        assert [q.author for q in scraper.extract_quotes_dynamic(soup)] == ["A"]
+        assert soup.select_one('li.next') is not None
+    
+    @patch('scraper.requests.Session.get')
+    def test_fetch_page_non_leading_quote_class(self, mock_get, scraper):
+        """Testa que 'quote' fora da primeira posição do class ainda é parseado"""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"""
+            <div class="card quote"><span class="text">"Q"</span>
+            <small class="author">A</small></div>
+        """)
+        
+        soup = scraper.fetch_page("http://test.com/non-leading/")
+        
+        assert [q.author for q in scraper.extract_quotes_dynamic(soup)] == ["A"]
+        assert [q.author for q in scraper.extract_quotes_fast(
+            '<div class="card quote"><span class="text">Q</span><small class="author">A</small></div>'
+        )] == ["A"]
     
+    def test_extract_quotes_fast_without_marker(self, scraper):
+        """Testa que HTML sem o marcador de citação não chega a nenhum parser"""
+        html = '<div class="quotes blockquote">No quotes found!</div>'
+        
+        with patch('scraper.lxml_html.fromstring') as mock_lxml, \
+                patch('scraper.QuotesScraper._extract_quotes_selectolax') as mock_selectolax:
+            assert scraper.extract_quotes_fast(html) == []
+            assert scraper.extract_quotes_fast(html.encode()) == []
+        
+        mock_lxml.assert_not_called()
+        mock_selectolax.assert_not_called()
+    
+    @patch('scraper.requests.Session.get')
+    def test_fetch_page_without_quotes_skips_parse(self, mock_get, scraper):
+        """Testa que página sem o marcador de citação não passa pelo parser"""
+        mock_get.return_value = Mock(
+            status_code=200, content=b'<html><body>No quotes found!</body></html>', headers={}
+        )
+        
+        with patch('scraper.BeautifulSoup', wraps=BeautifulSoup) as mock_soup:
+            soup = scraper.fetch_page("http://test.com/page/999/")
+        
+        assert mock_soup.call_args.args[0] == b''
+        assert scraper.extract_quotes_dynamic(soup) == []
+    
+    @patch('scraper.time.sleep')
     @patch('scraper.requests.Session.get')
-    def test_fetch_page_retry_on_failure(self, mock_get):
+    def test_fetch_page_retry_on_failure(self, mock_get, mock_sleep, scraper):
         """Testa retry automático em caso de falha"""
         mock_get.side_effect = requests.RequestException("Connection error")
         
-        scraper = QuotesScraper()
         soup = scraper.fetch_page("http://test.com")
         
         assert soup is None
         assert mock_get.call_count == ScraperConfig.RETRY_ATTEMPTS
+        assert mock_sleep.call_count == ScraperConfig.RETRY_ATTEMPTS - 1
     
-    def test_save_json(self, sample_quote, tmp_path):
-        """Testa salvamento em JSON"""
-        scraper = QuotesScraper()
+    @patch('scraper.requests.Session.get')
+    def test_fetch_page_not_modified_reuses_soup(self, mock_get, scraper):
+        """Testa que um 304 reaproveita a página parseada anteriormente"""
+        first = Mock(status_code=200, content=b'<html><body>Test</body></html>',
+                     headers={'ETag': '"abc"'})
+        second = Mock(status_code=304, content=b'', headers={})
+        mock_get.side_effect = [first, second]
+        
+        soup1 = scraper.fetch_page("http://test.com/cached")
+        soup2 = scraper.fetch_page("http://test.com/cached")
         
-        ScraperConfig.OUTPUT_DIR = tmp_path
+        assert soup2 is soup1
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+    
+    @patch('scraper.requests.Session.get')
+    def test_page_cache_is_bounded(self, mock_get, scraper):
+        """Testa que o cache de páginas descarta as mais antigas e pode ser limpo"""
+        mock_get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200, content=b'<html></html>', headers={'ETag': url}
+        )
+        urls = [f"http://test.com/bounded/{n}/" for n in range(3)]
         
-        filepath = scraper.save_json([sample_quote], "test_quotes.json")
+        with patch.object(ScraperConfig, 'MAX_CACHED_PAGES', 2):
+            for url in urls:
+                scraper.fetch_page(url)
+        
+        assert urls[0] not in scraper._soup_cache
+        assert urls[0] not in scraper._cache_headers
+        assert all(url in scraper._soup_cache for url in urls[1:])
+        
+        scraper.clear_cache()
+        assert not scraper._soup_cache and not scraper._cache_headers
+    
+    @patch('scraper.requests.Session.get')
+    def test_scrape_all_pages_stops_at_last_page(self, mock_get, scraper):
+        """Testa que a paginação concorrente para na página sem 'next'"""
+        def fake_get(url, **kwargs):
+            page = int(url.rstrip('/').rsplit('/', 1)[-1])
+            next_li = '<li class="next"><a href="#">Next</a></li>' if page < 3 else ''
+            response = Mock()
+            response.content = f"""
+            <div class="quote">
+                <span class="text">"Quote {page}"</span>
+                <small class="author">Author {page}</small>
+            </div>
+            <ul class="pager">{next_li}</ul>
+            """.encode('utf-8')
+            return response
+        mock_get.side_effect = fake_get
+        
+        quotes, screenshot = scraper.scrape_all_pages(take_screenshot=False, max_pages=5)
+        
+        assert [q.author for q in quotes] == ["Author 1", "Author 2", "Author 3"]
+        assert screenshot is None
+    
+    def test_save_json(self, scraper, sample_quote, tmp_path):
+        """Testa salvamento em JSON"""
+        filepath = scraper.save_json([sample_quote], "test_quotes.json", output_dir=tmp_path)
         
         assert filepath.exists()
         
@@ -199,96 +437,100 @@ class TestQuotesScraper:
         assert len(data) == 1
         assert data[0]['author'] == "Albert Einstein"
     
-    def test_save_csv(self, sample_quote, tmp_path):
-        """Testa salvamento em CSV"""
-        scraper = QuotesScraper()
+    def test_save_json_without_orjson(self, scraper, sample_quote, tmp_path):
+        """Testa que o fallback para o json padrão gera o mesmo conteúdo"""
+        with patch('scraper.ORJSON_AVAILABLE', False):
+            filepath = scraper.save_json([sample_quote], "test_quotes_stdlib.json", output_dir=tmp_path)
         
-        ScraperConfig.OUTPUT_DIR = tmp_path
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
         
-        filepath = scraper.save_csv([sample_quote], "test_quotes.csv")
+        assert data == [{
+            'text': sample_quote.text,
+            'author': sample_quote.author,
+            'tags': list(sample_quote.tags),
+            'scraped_at': sample_quote.scraped_at
+        }]
+    
+    def test_save_csv(self, scraper, sample_quote, tmp_path):
+        """Testa salvamento em CSV"""
+        filepath = scraper.save_csv([sample_quote], "test_quotes.csv", output_dir=tmp_path)
         
         assert filepath.exists()
         assert filepath.stat().st_size > 0
 
 
+class TestScreenshotManager:
+    """Testa a classe ScreenshotManager"""
+    
+    def test_reuse_today_skips_driver(self, tmp_path, monkeypatch):
+        """Testa que o screenshot de hoje é reaproveitado sem abrir o navegador"""
+        monkeypatch.setattr(ScraperConfig, 'SCREENSHOTS_DIR', tmp_path)
+        existing = tmp_path / f"screenshot_{datetime.now().strftime('%Y%m%d')}_080000.png"
+        existing.write_bytes(b'png')
+        
+        mgr = ScreenshotManager()
+        with patch.object(ScreenshotManager, 'setup_driver') as mock_setup:
+            path = mgr.take_screenshot("http://test.com", 0, reuse_today=True)
+        
+        assert path == str(existing)
+        mock_setup.assert_not_called()
+
+
 class TestDatabaseManager:
     """Testa a classe DatabaseManager real"""
     
     def test_database_initialization(self, temp_db):
         """Testa criação do banco de dados"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        assert temp_db.exists()
-        
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute(
+        with DatabaseManager(temp_db) as db:
+            assert temp_db.exists()
+            
+            cursor = db.conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table'"
             )
             tables = [row[0] for row in cursor.fetchall()]
         
         assert 'quotes' in tables
         assert 'execution_history' in tables
-        
-        del db
-        gc.collect()
     
-    def test_insert_quotes(self, temp_db, sample_quote):
+    def test_wal_pragmas(self, db):
+        """Testa que a conexão abre em WAL com synchronous=NORMAL"""
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    
+    def test_insert_quotes(self, db, sample_quote):
         """Testa inserção de quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
         inserted = db.insert_quotes([sample_quote])
         
         assert inserted == 1
         
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM quotes")
-            count = cursor.fetchone()[0]
+        count = db.conn.execute("SELECT COUNT(*) FROM quotes").fetchone()[0]
         
         assert count == 1
-        
-        del db
-        gc.collect()
     
-    def test_duplicate_prevention(self, temp_db, sample_quote):
+    def test_duplicate_prevention(self, db, sample_quote):
         """Testa que duplicatas não são inseridas"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
         inserted1 = db.insert_quotes([sample_quote])
         assert inserted1 == 1
         
         inserted2 = db.insert_quotes([sample_quote])
         assert inserted2 == 0
         
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM quotes")
-            count = cursor.fetchone()[0]
+        count = db.conn.execute("SELECT COUNT(*) FROM quotes").fetchone()[0]
         
         assert count == 1
-        
-        del db
-        gc.collect()
     
-    def test_get_all_quotes(self, temp_db, sample_quote):
+    def test_get_all_quotes(self, db, sample_quote):
         """Testa recuperação de todas as quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
         db.insert_quotes([sample_quote])
         
         quotes = db.get_all_quotes()
         
         assert len(quotes) == 1
         assert quotes[0]['author'] == "Albert Einstein"
-        
-        del db
-        gc.collect()
     
-    def test_get_statistics(self, temp_db, sample_quote):
+    def test_get_statistics(self, db, sample_quote):
         """Testa estatísticas do banco"""
-        import gc
-        db = DatabaseManager(temp_db)
         db.insert_quotes([sample_quote])
         
         stats = db.get_statistics()
@@ -296,41 +538,45 @@ class TestDatabaseManager:
         assert stats['total_quotes'] == 1
         assert stats['total_authors'] == 1
         assert 'scraped_at' in stats
-        
-        del db
-        gc.collect()
     
-    def test_log_execution(self, temp_db):
+    def test_log_execution(self, db):
         """Testa registro de histórico de execução"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        db.log_execution(
+        row_id = db.log_execution(
             scraped=100,
             inserted=95,
             status='success',
             screenshot='test.png'
         )
         
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT * FROM execution_history")
-            row = cursor.fetchone()
+        row = db.conn.execute(
+            "SELECT * FROM execution_history WHERE id = ?", (row_id,)
+        ).fetchone()
         
         assert row is not None
         assert row[2] == 100
         assert row[3] == 95
+    
+    def test_export_csv_and_json(self, db, sample_quote, tmp_path):
+        """Testa exportação direta do banco para CSV e JSON"""
+        db.insert_quotes([sample_quote])
         
-        del db
-        gc.collect()
+        csv_path = db.export_csv(tmp_path / "quotes.csv")
+        json_path = db.export_json(tmp_path / "quotes.json")
+        
+        csv_lines = csv_path.read_text(encoding='utf-8').splitlines()
+        assert csv_lines[0] == "text,author,tags,scraped_at"
+        assert "change|deep-thoughts|thinking" in csv_lines[1]
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data[0]['author'] == "Albert Einstein"
+        assert data[0]['tags'] == list(sample_quote.tags)
 
 
 class TestDataFrameAnalyzer:
     """Testa a classe DataFrameAnalyzer real"""
     
-    def test_create_dataframe(self, temp_db, sample_quote):
+    def test_create_dataframe(self, db, sample_quote):
         """Testa criação de DataFrame real"""
-        import gc
-        db = DatabaseManager(temp_db)
         db.insert_quotes([sample_quote])
         
         quotes_data = db.get_all_quotes()
@@ -341,15 +587,9 @@ class TestDataFrameAnalyzer:
             assert 'author' in df.columns
             assert 'text' in df.columns
             assert 'tag_count' in df.columns
-        
-        del db
-        gc.collect()
     
-    def test_dataframe_with_multiple_quotes(self, temp_db):
+    def test_dataframe_with_multiple_quotes(self, db):
         """Testa DataFrame com múltiplas quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
         quotes = [
             Quote("Quote 1", "Author A", ["tag1"], datetime.now().isoformat()),
             Quote("Quote 2", "Author B", ["tag1", "tag2"], datetime.now().isoformat()),
@@ -363,9 +603,73 @@ class TestDataFrameAnalyzer:
         if df is not None:
             assert len(df) == 3
             assert df[df['author'] == 'Author A'].shape[0] == 2
+    
+    def test_create_dataframe_with_decoded_tags(self):
+        """Testa DataFrame a partir de dicts cujas tags já são listas"""
+        quotes_data = [
+            {'text': "Quote 1", 'author': "Author A", 'tags': ["tag1", "tag2"],
+             'scraped_at': datetime.now().isoformat()},
+        ]
+        
+        df = DataFrameAnalyzer.create_dataframe(quotes_data)
         
-        del db
-        gc.collect()
+        assert df is not None
+        assert df['tags'].iloc[0] == ["tag1", "tag2"]
+        assert df['tag_count'].iloc[0] == 2
+    
+    def test_create_dataframe_without_pandas(self, db):
+        """Testa a QuoteTable usada quando o pandas não está disponível"""
+        db.insert_quotes([
+            Quote("Quote 1", "Author A", ["tag1"], datetime.now().isoformat()),
+            Quote("Quote 2", "Author B", ["tag1", "tag2"], datetime.now().isoformat()),
+            Quote("Quote 3", "Author A", ["tag1"], datetime.now().isoformat()),
+        ])
+        
+        with patch('scraper.PANDAS_AVAILABLE', False):
+            table = DataFrameAnalyzer.create_dataframe(load_quotes_data(db))
+        
+        assert isinstance(table, QuoteTable)
+        assert len(table) == 3
+        assert 'author' in table.columns
+        assert 'tag_count' in table.columns
+        assert table[table['author'].eq('Author A')].shape[0] == 2
+        assert table[table['author'].ne('Author A')]['author'] == ['Author B']
+        assert (table['author'] == ['Author A']) is False
+        assert sorted(table['tag_count']) == [1, 1, 2]
+    
+    def test_display_and_analysis_without_pandas(self, tmp_path, capsys):
+        """Testa exibição e análise da QuoteTable, com tags já decodificadas"""
+        quotes_data = [
+            {'text': "Quote 1", 'author': "Author A", 'tags': ["tag1"],
+             'scraped_at': datetime.now().isoformat()},
+            {'text': "Quote 22", 'author': "Author B", 'tags': '["tag1", "tag2"]',
+             'scraped_at': datetime.now().isoformat()},
+            {'text': "Quote 333", 'author': "Author A", 'tags': '["tag1", "tag2", "tag3"]',
+             'scraped_at': datetime.now().isoformat()},
+        ]
+        
+        with patch('scraper.PANDAS_AVAILABLE', False):
+            table = DataFrameAnalyzer.create_dataframe(quotes_data)
+        DataFrameAnalyzer.display_dataframe(table)
+        DataFrameAnalyzer.save_analysis(table, output_dir=tmp_path)
+        
+        assert " 1. Author A" in capsys.readouterr().out
+        lines = (tmp_path / "analysis.csv").read_text(encoding='utf-8').splitlines()
+        assert lines == [
+            "author,quote_count,avg_text_length,avg_tags",
+            "Author A,2,8.0,2.0",
+            "Author B,1,8.0,2.0",
+        ]
+    
+    def test_create_dataframe_from_sql(self, db, sample_quote):
+        """Testa DataFrame lido direto do SQLite"""
+        db.insert_quotes([sample_quote])
+        
+        df = DataFrameAnalyzer.create_dataframe(db.get_all_quotes_df())
+        
+        assert len(df) == 1
+        assert df['tags'].iloc[0] == list(sample_quote.tags)
+        assert df['tag_count'].iloc[0] == 3
 
 
 class TestScraperConfig:
@@ -373,12 +677,9 @@ class TestScraperConfig:
     
     def test_config_has_required_attributes(self):
         """Testa que config tem todos os atributos necessários"""
-        assert hasattr(ScraperConfig, 'BASE_URL')
-        assert hasattr(ScraperConfig, 'OUTPUT_DIR')
-        assert hasattr(ScraperConfig, 'LOGS_DIR')
-        assert hasattr(ScraperConfig, 'SCREENSHOTS_DIR')
-        assert hasattr(ScraperConfig, 'TIMEOUT')
-        assert hasattr(ScraperConfig, 'RETRY_ATTEMPTS')
+        required = {'BASE_URL', 'OUTPUT_DIR', 'LOGS_DIR', 'SCREENSHOTS_DIR',
+                    'TIMEOUT', 'RETRY_ATTEMPTS'}
+        assert required <= set(vars(ScraperConfig))
     
     def test_config_values(self):
         """Testa valores da configuração"""
@@ -388,502 +689,126 @@ class TestScraperConfig:
     
     def test_setup_dirs_creates_directories(self, tmp_path):
         """Testa criação de diretórios"""
-        original_output = ScraperConfig.OUTPUT_DIR
-        original_logs = ScraperConfig.LOGS_DIR
-        original_screenshots = ScraperConfig.SCREENSHOTS_DIR
-        
-        ScraperConfig.OUTPUT_DIR = tmp_path / "data"
-        ScraperConfig.LOGS_DIR = tmp_path / "logs"
-        ScraperConfig.SCREENSHOTS_DIR = tmp_path / "screenshots"
-        
-        ScraperConfig.setup_dirs()
-        
-        assert ScraperConfig.OUTPUT_DIR.exists()
-        assert ScraperConfig.LOGS_DIR.exists()
-        assert ScraperConfig.SCREENSHOTS_DIR.exists()
-        
-        ScraperConfig.OUTPUT_DIR = original_output
-        ScraperConfig.LOGS_DIR = original_logs
-        ScraperConfig.SCREENSHOTS_DIR = original_screenshots
-
-
-class TestIntegration:
-    """Testes de integração - fluxo completo"""
-    
-    @patch('scraper.requests.Session.get')
-    def test_full_scrape_flow(self, mock_get, temp_db, sample_html):
-        """Testa fluxo completo: scrape -> database -> export"""
-        import gc
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_html.encode('utf-8')
-        mock_get.return_value = mock_response
-        
-        scraper = QuotesScraper()
-        soup = scraper.fetch_page("http://test.com")
-        quotes = scraper.extract_quotes_dynamic(soup)
-        
-        assert len(quotes) > 0
-        
-        db = DatabaseManager(temp_db)
-        inserted = db.insert_quotes(quotes)
-        
-        assert inserted > 0
-        
-        stats = db.get_statistics()
-        
-        assert stats['total_quotes'] > 0
-        
-        del db
-        del scraper
-        gc.collect()
-
-
-class TestEdgeCases:
-    """Testes de casos extremos e situações incomuns"""
-    
-    def test_empty_html(self):
-        """Testa HTML vazio"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup("", 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
-        
-        assert len(quotes) == 0
-    
-    def test_malformed_html(self):
-        """Testa HTML malformado"""
-        scraper = QuotesScraper()
-        malformed = "<div class='quote'><span class='text'>Quote</div>"
-        soup = BeautifulSoup(malformed, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
-        assert isinstance(quotes, list)
-    
-    def test_quote_without_tags(self):
-        """Testa quote sem tags"""
-        scraper = QuotesScraper()
-        html = """
-        <div class="quote">
-            <span class="text">"Quote without tags"</span>
-            <small class="author">Author</small>
-        </div>
-        """
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
-        
-        assert len(quotes) == 1
-        assert quotes[0].tags == []
-
-
-if __name__ == '__main__':
-    pytest.main([__file__, '-v', '--tb=short'])
-
-
-@pytest.fixture
-def temp_db():
-    """Cria banco de dados temporário para testes"""
-    import gc
-    temp_dir = tempfile.TemporaryDirectory()
-    db_path = Path(temp_dir.name) / "test_quotes.db"
-    yield db_path
-    gc.collect()  
-    try:
-        import time
-        time.sleep(0.1)
-        try:
-            temp_dir.cleanup()
-        except PermissionError:
-            pass
-    except Exception:
-        pass
-
-
-@pytest.fixture
-def sample_quote():
-    """Cria uma Quote de exemplo"""
-    return Quote(
-        text="The world as we have created it is a process of our thinking.",
-        author="Albert Einstein",
-        tags=["change", "deep-thoughts", "thinking"],
-        scraped_at=datetime.now().isoformat()
-    )
-
-
-@pytest.fixture
-def sample_html():
-    """HTML real do site quotes.toscrape.com"""
-    return """
-    <div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
-        <span class="text" itemprop="text">"The world as we have created it is a process of our thinking. It cannot be changed without changing our thinking."</span>
-        <span>by <small class="author" itemprop="author">Albert Einstein</small>
-        <a href="/author/Albert-Einstein">(about)</a>
-        </span>
-        <div class="tags">
-            Tags:
-            <meta class="keywords" itemprop="keywords" content="change,deep-thoughts,thinking" />
-            <a class="tag" href="/tag/change/page/1/">change</a>
-            <a class="tag" href="/tag/deep-thoughts/page/1/">deep-thoughts</a>
-            <a class="tag" href="/tag/thinking/page/1/">thinking</a>
-        </div>
-    </div>
-    """
-
-
-@pytest.fixture
-def sample_html_multiple():
-    """HTML com múltiplas quotes"""
-    return """
-    <div class="quote">
-        <span class="text">"Quote 1"</span>
-        <small class="author">Author 1</small>
-        <div class="tags">
-            <a class="tag">tag1</a>
-        </div>
-    </div>
-    <div class="quote">
-        <span class="text">"Quote 2"</span>
-        <small class="author">Author 2</small>
-        <div class="tags">
-            <a class="tag">tag2</a>
-            <a class="tag">tag3</a>
-        </div>
-    </div>
-    """
-
-
-class TestQuoteModel:
-    """Testa a classe Quote real"""
-    
-    def test_quote_creation(self, sample_quote):
-        """Testa criação de Quote"""
-        assert sample_quote.text == "The world as we have created it is a process of our thinking."
-        assert sample_quote.author == "Albert Einstein"
-        assert len(sample_quote.tags) == 3
-        assert "change" in sample_quote.tags
-    
-    def test_quote_dataclass_fields(self, sample_quote):
-        """Testa que Quote tem todos os campos necessários"""
-        assert hasattr(sample_quote, 'text')
-        assert hasattr(sample_quote, 'author')
-        assert hasattr(sample_quote, 'tags')
-        assert hasattr(sample_quote, 'scraped_at')
-    
-    def test_quote_serialization(self, sample_quote):
-        """Testa conversão para dict"""
-        from dataclasses import asdict
-        quote_dict = asdict(sample_quote)
+        ScraperConfig.setup_dirs(
+            output_dir=tmp_path / "data",
+            logs_dir=tmp_path / "logs",
+            screenshots_dir=tmp_path / "screenshots"
+        )
         
-        assert 'text' in quote_dict
-        assert 'author' in quote_dict
-        assert 'tags' in quote_dict
-        assert quote_dict['author'] == "Albert Einstein"
+        assert (tmp_path / "data").exists()
+        assert (tmp_path / "logs").exists()
+        assert (tmp_path / "screenshots").exists()
 
 
-class TestQuotesScraper:
-    """Testa a classe QuotesScraper real"""
+class TestConfig:
+    """Testa o módulo config"""
     
-    def test_scraper_initialization(self):
-        """Testa criação do scraper"""
-        scraper = QuotesScraper()
-        assert scraper is not None
-        assert hasattr(scraper, 'session')
-        assert hasattr(scraper, 'screenshot_mgr')
+    def test_get_config_unknown_env_falls_back_to_development(self):
+        """Testa que ambiente desconhecido usa a configuração de desenvolvimento"""
+        assert config.get_config("staging") is config.DEVELOPMENT_CONFIG
+        assert config.get_config("testing") is config.TESTING_CONFIG
     
-    def test_extract_quotes_dynamic(self, sample_html):
-        """Testa extração REAL de quotes do HTML"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup(sample_html, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
-        
-        assert len(quotes) == 1
-        assert quotes[0].author == "Albert Einstein"
-        assert "change" in quotes[0].tags
+    def test_scheduler_time_parsed(self):
+        """Testa a conversão de SCHEDULER_TIME feita em __post_init__"""
+        cfg = config.Config(SCHEDULER_TIME="08:15")
+        assert cfg.SCHEDULER_TIME_PARSED == dt_time(8, 15)
     
-    def test_extract_multiple_quotes(self, sample_html_multiple):
-        """Testa extração de múltiplas quotes"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup(sample_html_multiple, 'html.parser')
-        
-        quotes = scraper.extract_quotes_dynamic(soup)
-        
-        assert len(quotes) == 2
-        assert quotes[0].author == "Author 1"
-        assert quotes[1].author == "Author 2"
+    def test_scheduler_time_invalid(self):
+        """Testa que horário inválido falha na criação da Config"""
+        with pytest.raises(ValueError):
+            config.Config(SCHEDULER_TIME="25:99")
     
-    @patch('scraper.requests.Session.get')
-    def test_fetch_page_success(self, mock_get):
-        """Testa busca de página com sucesso"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'<html><body>Test</body></html>'
-        mock_get.return_value = mock_response
-        
-        scraper = QuotesScraper()
-        soup = scraper.fetch_page("http://test.com")
-        
-        assert soup is not None
-        assert soup.find('body') is not None
+    def test_app_config_lazy_access(self, monkeypatch):
+        """Testa que app_config só é criado no primeiro acesso"""
+        monkeypatch.setattr(config, "_app_config", None)
+        app = config.app_config
+        assert isinstance(app, config.AppConfig)
+        assert config.app_config is app
+        assert config.get_app_config() is app
     
-    @patch('scraper.requests.Session.get')
-    def test_fetch_page_retry_on_failure(self, mock_get):
-        """Testa retry automático em caso de falha"""
-        mock_get.side_effect = requests.RequestException("Connection error")
-        
-        scraper = QuotesScraper()
-        soup = scraper.fetch_page("http://test.com")
-        
-        assert soup is None
-        assert mock_get.call_count == ScraperConfig.RETRY_ATTEMPTS
+    @pytest.mark.parametrize("raw", ["by Jane Austen", "By Jane Austen", "BY  Jane Austen"])
+    def test_clean_author_strips_prefix(self, raw):
+        """Testa que clean_author remove o prefixo 'by' sem diferenciar maiúsculas"""
+        assert config.SelectorConfig.clean_author(raw) == "Jane Austen"
     
-    def test_save_json(self, sample_quote, tmp_path):
-        """Testa salvamento em JSON"""
-        scraper = QuotesScraper()
-        
-        ScraperConfig.OUTPUT_DIR = tmp_path
-        
-        filepath = scraper.save_json([sample_quote], "test_quotes.json")
-        
-        assert filepath.exists()
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        assert len(data) == 1
-        assert data[0]['author'] == "Albert Einstein"
+    def test_make_quote_uses_clean_author(self, scraper):
+        """Testa que a extração limpa o autor via SelectorConfig"""
+        html = '<div class="quote"><span class="text">"Q"</span><small class="author">By Ann</small></div>'
+        assert [q.author for q in scraper.extract_quotes_fast(html)] == ["Ann"]
     
-    def test_save_csv(self, sample_quote, tmp_path):
-        """Testa salvamento em CSV"""
-        scraper = QuotesScraper()
-        
-        ScraperConfig.OUTPUT_DIR = tmp_path
-        
-        filepath = scraper.save_csv([sample_quote], "test_quotes.csv")
-        
-        assert filepath.exists()
-        
-        assert filepath.stat().st_size > 0
+    def test_clean_text_removes_quotes(self):
+        """Testa que clean_text remove aspas retas e tipográficas"""
+        assert config.SelectorConfig.clean_text('\u201cHello\u201d "world"') == 'Hello world'
 
 
-class TestDatabaseManager:
-    """Testa a classe DatabaseManager real"""
-    
-    def test_database_initialization(self, temp_db):
-        """Testa criação do banco de dados"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        assert temp_db.exists()
-        
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            )
-            tables = [row[0] for row in cursor.fetchall()]
-        
-        assert 'quotes' in tables
-        assert 'execution_history' in tables
-        
-        del db
-        gc.collect()
-    
-    def test_insert_quotes(self, temp_db, sample_quote):
-        """Testa inserção de quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        inserted = db.insert_quotes([sample_quote])
-        
-        assert inserted == 1
-        
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM quotes")
-            count = cursor.fetchone()[0]
-        
-        assert count == 1
-   
-        del db
-        gc.collect()
+class TestTaskScheduler:
+    """Testa a classe TaskScheduler"""
     
-    def test_duplicate_prevention(self, temp_db, sample_quote):
-        """Testa que duplicatas não são inseridas"""
-        import gc
-        db = DatabaseManager(temp_db)
+    def test_schedule_future_scrape(self):
+        """Testa agendamento de data futura"""
+        scheduler = TaskScheduler()
+        scheduler.start()
         
-        inserted1 = db.insert_quotes([sample_quote])
-        assert inserted1 == 1
-     
-        inserted2 = db.insert_quotes([sample_quote])
-        assert inserted2 == 0 
-        
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM quotes")
-            count = cursor.fetchone()[0]
-        
-        assert count == 1
-        
-        del db
-        gc.collect()
-    
-    def test_get_all_quotes(self, temp_db, sample_quote):
-        """Testa recuperação de todas as quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
-        db.insert_quotes([sample_quote])
-        
-        quotes = db.get_all_quotes()
-        
-        assert len(quotes) == 1
-        assert quotes[0]['author'] == "Albert Einstein"
-        
-        del db
-        gc.collect()
-    
-    def test_get_statistics(self, temp_db, sample_quote):
-        """Testa estatísticas do banco"""
-        import gc
-        db = DatabaseManager(temp_db)
-        db.insert_quotes([sample_quote])
-        
-        stats = db.get_statistics()
-        
-        assert stats['total_quotes'] == 1
-        assert stats['total_authors'] == 1
-        assert 'scraped_at' in stats
-        
-        del db
-        gc.collect()
-    
-    def test_log_execution(self, temp_db):
-        """Testa registro de histórico de execução"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        db.log_execution(
-            scraped=100,
-            inserted=95,
-            status='success',
-            screenshot='test.png'
+        run_date = (datetime.now() + timedelta(days=1)).replace(second=0, microsecond=0)
+        result = scheduler.schedule_scrape(
+            run_date.strftime("%d/%m/%Y"), run_date.strftime("%H:%M")
         )
+        jobs = scheduler.list_scheduled()
         
-        with sqlite3.connect(temp_db) as conn:
-            cursor = conn.execute("SELECT * FROM execution_history")
-            row = cursor.fetchone()
+        assert result is True
+        assert len(jobs) == 1
+        assert jobs[0]['status'] == 'scheduled'
+        assert jobs[0]['run_date'] == run_date.isoformat()
         
-        assert row is not None
-        assert row[2] == 100 
-        assert row[3] == 95  
-        
-        del db
-        gc.collect()
-
-
-class TestDataFrameAnalyzer:
-    """Testa a classe DataFrameAnalyzer real"""
+        scheduler.stop()
+        assert all(timer.finished.is_set() for timer in scheduler.timers.values())
     
-    def test_create_dataframe(self, temp_db, sample_quote):
-        """Testa criação de DataFrame real"""
-        import gc
-        db = DatabaseManager(temp_db)
-        db.insert_quotes([sample_quote])
-        
-        quotes_data = db.get_all_quotes()
-        df = DataFrameAnalyzer.create_dataframe(quotes_data)
+    def test_stop_waits_for_running_job(self):
+        """Testa que stop() espera o job em andamento antes de retornar"""
+        scheduler = TaskScheduler()
+        started, release = threading.Event(), threading.Event()
+        finished = []
         
-        if df is not None: 
-            assert len(df) == 1
-            assert 'author' in df.columns
-            assert 'text' in df.columns
-            assert 'tag_count' in df.columns
-        
-        del db
-        gc.collect()
-    
-    def test_dataframe_with_multiple_quotes(self, temp_db):
-        """Testa DataFrame com múltiplas quotes"""
-        import gc
-        db = DatabaseManager(temp_db)
-        
-        quotes = [
-            Quote("Quote 1", "Author A", ["tag1"], datetime.now().isoformat()),
-            Quote("Quote 2", "Author B", ["tag1", "tag2"], datetime.now().isoformat()),
-            Quote("Quote 3", "Author A", ["tag1"], datetime.now().isoformat()),
-        ]
+        def job():
+            started.set()
+            release.wait(timeout=5)
+            finished.append(True)
         
-        db.insert_quotes(quotes)
-        quotes_data = db.get_all_quotes()
-        df = DataFrameAnalyzer.create_dataframe(quotes_data)
+        scheduler.timers['running'] = threading.Timer(0, job)
+        scheduler.start()
+        assert started.wait(timeout=5)
         
-        if df is not None:
-            assert len(df) == 3
-            assert df[df['author'] == 'Author A'].shape[0] == 2
+        threading.Timer(0.05, release.set).start()
+        scheduler.stop()
         
-        del db
-        gc.collect()
-
-
-class TestScraperConfig:
-    """Testa a classe ScraperConfig"""
-    
-    def test_config_has_required_attributes(self):
-        """Testa que config tem todos os atributos necessários"""
-        assert hasattr(ScraperConfig, 'BASE_URL')
-        assert hasattr(ScraperConfig, 'OUTPUT_DIR')
-        assert hasattr(ScraperConfig, 'LOGS_DIR')
-        assert hasattr(ScraperConfig, 'SCREENSHOTS_DIR')
-        assert hasattr(ScraperConfig, 'TIMEOUT')
-        assert hasattr(ScraperConfig, 'RETRY_ATTEMPTS')
+        assert finished == [True]
+        assert not scheduler.timers['running'].is_alive()
     
-    def test_config_values(self):
-        """Testa valores da configuração"""
-        assert ScraperConfig.BASE_URL == "http://quotes.toscrape.com"
-        assert ScraperConfig.RETRY_ATTEMPTS >= 1
-        assert ScraperConfig.TIMEOUT > 0
-    
-    def test_setup_dirs_creates_directories(self, tmp_path):
-        """Testa criação de diretórios"""
-        original_output = ScraperConfig.OUTPUT_DIR
-        original_logs = ScraperConfig.LOGS_DIR
-        original_screenshots = ScraperConfig.SCREENSHOTS_DIR
-        
-        ScraperConfig.OUTPUT_DIR = tmp_path / "data"
-        ScraperConfig.LOGS_DIR = tmp_path / "logs"
-        ScraperConfig.SCREENSHOTS_DIR = tmp_path / "screenshots"
+    def test_schedule_past_date_fails(self):
+        """Testa que datas passadas não são agendadas"""
+        scheduler = TaskScheduler()
         
-        ScraperConfig.setup_dirs()
-        
-        assert ScraperConfig.OUTPUT_DIR.exists()
-        assert ScraperConfig.LOGS_DIR.exists()
-        assert ScraperConfig.SCREENSHOTS_DIR.exists()
-        
-        ScraperConfig.OUTPUT_DIR = original_output
-        ScraperConfig.LOGS_DIR = original_logs
-        ScraperConfig.SCREENSHOTS_DIR = original_screenshots
+        assert scheduler.schedule_scrape("01/01/2000", "10:30") is False
+        assert scheduler.list_scheduled() == []
 
 
 class TestIntegration:
     """Testes de integração - fluxo completo"""
     
+    @patch('scraper.time.sleep')
     @patch('scraper.requests.Session.get')
-    def test_full_scrape_flow(self, mock_get, temp_db, sample_html):
+    def test_full_scrape_flow(self, mock_get, mock_sleep, scraper, db, sample_html):
         """Testa fluxo completo: scrape -> database -> export"""
-        import gc
-        
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = sample_html.encode('utf-8')
         mock_get.return_value = mock_response
         
-        scraper = QuotesScraper()
         soup = scraper.fetch_page("http://test.com")
         quotes = scraper.extract_quotes_dynamic(soup)
         
         assert len(quotes) > 0
         
-        db = DatabaseManager(temp_db)
         inserted = db.insert_quotes(quotes)
         
         assert inserted > 0
@@ -891,49 +816,56 @@ class TestIntegration:
         stats = db.get_statistics()
         
         assert stats['total_quotes'] > 0
-        
-        del db
-        del scraper
-        gc.collect()
-
 
 
 class TestEdgeCases:
     """Testes de casos extremos e situações incomuns"""
     
-    def test_empty_html(self):
+    def test_empty_html(self, scraper):
         """Testa HTML vazio"""
-        scraper = QuotesScraper()
-        soup = BeautifulSoup("", 'html.parser')
+        soup = BeautifulSoup("", 'lxml', parse_only=PAGE_STRAINER)
         
         quotes = scraper.extract_quotes_dynamic(soup)
         
         assert len(quotes) == 0
     
-    def test_malformed_html(self):
+    def test_malformed_html(self, scraper):
         """Testa HTML malformado"""
-        scraper = QuotesScraper()
         malformed = "<div class='quote'><span class='text'>Quote</div>"
-        soup = BeautifulSoup(malformed, 'html.parser')
+        soup = BeautifulSoup(malformed, 'lxml', parse_only=PAGE_STRAINER)
         
         quotes = scraper.extract_quotes_dynamic(soup)
         assert isinstance(quotes, list)
     
-    def test_quote_without_tags(self):
+    def test_quote_without_tags(self, scraper):
         """Testa quote sem tags"""
-        scraper = QuotesScraper()
         html = """
         <div class="quote">
             <span class="text">"Quote without tags"</span>
             <small class="author">Author</small>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', parse_only=PAGE_STRAINER)
         
         quotes = scraper.extract_quotes_dynamic(soup)
         
         assert len(quotes) == 1
-        assert quotes[0].tags == []  
+        assert quotes[0].tags == ()
+    
+    def test_fast_path_edge_cases(self, scraper):
+        """Testa extract_quotes_fast com HTML vazio, malformado e sem tags"""
+        no_tags = """
+        <div class="quote">
+            <span class="text">"Quote without tags"</span>
+            <small class="author">Author</small>
+        </div>
+        """
+        
+        assert scraper.extract_quotes_fast("") == []
+        assert isinstance(
+            scraper.extract_quotes_fast("<div class='quote'><span class='text'>Quote</div>"), list
+        )
+        assert scraper.extract_quotes_fast(no_tags)[0].tags == ()
 
 
 if __name__ == '__main__':